@@ -1,21 +1,58 @@
+import random
+import sys
+import time
+from bisect import bisect_right
+
+import numpy as np
 from colorama import init, Fore, Style
 
+from table_export import write_dp_table
+from table_render import render_table
+
+
+def _numpy_dtype(profits):
+    # Keep integer profits exact; fall back to floats only when needed
+    if any(isinstance(p, float) for p in profits):
+        return np.float64
+    return np.int64
+
+
+def _numpy_row_update(prev, weight, profit):
+    # Row for one more item as a single shifted-array maximum over the
+    # previous row: new[w] = max(prev[w], prev[w - weight] + profit)
+    row = prev.copy()
+    if weight < len(prev):
+        np.maximum(prev[weight:], prev[:len(prev) - weight] + profit, out=row[weight:])
+    return row
+
 
-def knapsack(weights, profits, capacity):
+def _knapsack_table(weights, profits, capacity, backend="python"):
     n = len(weights)
-    # Initialize DP table
-    dp = [[0 for _ in range(capacity + 1)] for _ in range(n + 1)]
-
-    # Build the DP table in bottom-up fashion
-    for i in range(1, n + 1):
-        for w in range(capacity + 1):
-            if weights[i - 1] <= w:
-                dp[i][w] = max(profits[i - 1] + dp[i - 1][w - weights[i - 1]],
-                               dp[i - 1][w])
-            else:
-                dp[i][w] = dp[i - 1][w]
+    if backend == "numpy":
+        # Initialize DP table; each row is one vectorized update
+        dp = np.zeros((n + 1, capacity + 1), dtype=_numpy_dtype(profits))
+        for i in range(1, n + 1):
+            dp[i] = _numpy_row_update(dp[i - 1], weights[i - 1], profits[i - 1])
+    elif backend == "python":
+        # Initialize DP table
+        dp = [[0 for _ in range(capacity + 1)] for _ in range(n + 1)]
+
+        # Build the DP table in bottom-up fashion
+        for i in range(1, n + 1):
+            for w in range(capacity + 1):
+                if weights[i - 1] <= w:
+                    dp[i][w] = max(profits[i - 1] + dp[i - 1][w - weights[i - 1]],
+                                   dp[i - 1][w])
+                else:
+                    dp[i][w] = dp[i - 1][w]
+    else:
+        raise ValueError(f"Unknown knapsack backend '{backend}'")
+    return dp
 
+
+def _knapsack_traceback(dp, weights, profits, capacity):
     # Traceback to find the items to include
+    n = len(weights)
     res = dp[n][capacity]
     w = capacity
     items_selected = []
@@ -27,8 +64,264 @@ def knapsack(weights, profits, capacity):
             res -= profits[i - 1]
             w -= weights[i - 1]
     items_selected.reverse()
+    return items_selected
+
+
+def knapsack(weights, profits, capacity, backend="python"):
+    n = len(weights)
+    dp = _knapsack_table(weights, profits, capacity, backend)
+    items_selected = _knapsack_traceback(dp, weights, profits, capacity)
+
+    return dp, dp[n][capacity].item() if backend == "numpy" else dp[n][capacity], items_selected
+
+
+def knapsack_multi_capacity(weights, profits, capacities, backend="python"):
+    """
+    Answers knapsack queries for many capacities from a single DP table.
+
+    The table is built once up to the largest requested capacity; its last
+    row already holds the optimum for every smaller capacity. Items are
+    traced back only for the capacities that were actually requested.
+
+    :param weights: List of item weights.
+    :param profits: List of item profits.
+    :param capacities: List of capacities to answer.
+    :param backend: "python" or "numpy", as in knapsack().
+    :return: List of (capacity, max_profit, items_selected) in request order.
+    """
+    if not capacities:
+        return []
+    if min(capacities) < 0:
+        raise ValueError("Capacities must be at least 0")
+    n = len(weights)
+    dp = _knapsack_table(weights, profits, max(capacities), backend)
+
+    results = []
+    traced = {}
+    for capacity in capacities:
+        if capacity not in traced:
+            max_profit = dp[n][capacity]
+            if backend == "numpy":
+                max_profit = max_profit.item()
+            traced[capacity] = (max_profit, _knapsack_traceback(dp, weights, profits, capacity))
+        max_profit, items_selected = traced[capacity]
+        results.append((capacity, max_profit, list(items_selected)))
+
+    return results
+
+
+def _knapsack_row(weights, profits, capacity, items, backend="python"):
+    # Single O(capacity) DP row over the given items. Capacities are scanned
+    # downwards so each item is used at most once.
+    if backend == "numpy":
+        row = np.zeros(capacity + 1, dtype=_numpy_dtype(profits))
+        for i in items:
+            row = _numpy_row_update(row, weights[i], profits[i])
+        return row
+    if backend != "python":
+        raise ValueError(f"Unknown knapsack backend '{backend}'")
+    row = [0] * (capacity + 1)
+    for i in items:
+        weight, profit = weights[i], profits[i]
+        for w in range(capacity, weight - 1, -1):
+            candidate = row[w - weight] + profit
+            if candidate > row[w]:
+                row[w] = candidate
+    return row
+
+
+def knapsack_space_optimized(weights, profits, capacity, backend="python"):
+    """
+    Solves the 0/1 knapsack problem keeping only O(capacity) DP rows.
+
+    Items are recovered Hirschberg-style: the item range is split in half, a
+    forward row is computed for the left half and another for the right half,
+    and the capacity split that maximizes their sum tells how much capacity
+    each half gets in an optimal solution. Both halves are then solved
+    recursively, so no full (n+1) x (capacity+1) table is ever built.
+
+    :param weights: List of item weights.
+    :param profits: List of item profits.
+    :param capacity: Knapsack capacity.
+    :param backend: "python" for the plain loop, "numpy" for vectorized rows.
+    :return: (max_profit, items_selected) with 0-based item indices in order.
+    """
+    items_selected = []
+
+    def solve(lo, hi, cap):
+        if hi - lo == 1:
+            if weights[lo] <= cap and profits[lo] > 0:
+                items_selected.append(lo)
+            return
+        mid = (lo + hi) // 2
+        left = _knapsack_row(weights, profits, cap, range(lo, mid), backend)
+        right = _knapsack_row(weights, profits, cap, range(mid, hi), backend)
+        if backend == "numpy":
+            split = int(np.argmax(left + right[::-1]))
+        else:
+            split = max(range(cap + 1), key=lambda c: left[c] + right[cap - c])
+        # Release the rows before recursing so only O(capacity) stays alive
+        del left, right
+        solve(lo, mid, split)
+        solve(mid, hi, cap - split)
+
+    if weights and capacity >= 0:
+        solve(0, len(weights), capacity)
+    max_profit = sum(profits[i] for i in items_selected)
+
+    return max_profit, items_selected
+
+
+class IncrementalKnapsack:
+    """
+    0/1 knapsack solver that accepts items one at a time.
+
+    Only the last DP row is kept, together with a provenance chain per
+    capacity: each entry is (item_index, previous_entry) or None, so chains
+    share their tails and old rows are never stored. Adding an item costs
+    O(capacity) and item-set queries cost O(number of items selected).
+    """
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.weights = []
+        self.profits = []
+        self.row = [0] * (capacity + 1)
+        self._chosen = [None] * (capacity + 1)
+
+    def add_item(self, weight, profit):
+        index = len(self.weights)
+        self.weights.append(weight)
+        self.profits.append(profit)
+
+        row, chosen = self.row, self._chosen
+        # Scan downwards so row[w - weight] still holds the previous row's value
+        for w in range(self.capacity, weight - 1, -1):
+            candidate = row[w - weight] + profit
+            if candidate > row[w]:
+                row[w] = candidate
+                chosen[w] = (index, chosen[w - weight])
+        return index
+
+    def add_items(self, weights, profits):
+        if len(weights) != len(profits):
+            raise ValueError("The number of weights and profits must be the same.")
+        for weight, profit in zip(weights, profits):
+            self.add_item(weight, profit)
 
-    return dp, dp[n][capacity], items_selected
+    def max_profit(self, capacity=None):
+        if capacity is None:
+            capacity = self.capacity
+        if not 0 <= capacity <= self.capacity:
+            raise ValueError(f"Capacity must be between 0 and {self.capacity}")
+        return self.row[capacity]
+
+    def items_selected(self, capacity=None):
+        if capacity is None:
+            capacity = self.capacity
+        if not 0 <= capacity <= self.capacity:
+            raise ValueError(f"Capacity must be between 0 and {self.capacity}")
+        items = []
+        entry = self._chosen[capacity]
+        while entry is not None:
+            index, entry = entry
+            items.append(index)
+        items.reverse()
+        return items
+
+
+def knapsack_branch_and_bound(weights, profits, capacity, max_nodes=None, time_limit=None):
+    """
+    Solves the 0/1 knapsack problem by depth-first branch and bound.
+
+    Unlike the DP solvers, the running time does not depend on the capacity,
+    so this handles huge capacities (e.g. 10^9) with a modest number of items.
+    The upper bound at each node is the node's profit plus the greedy
+    fractional relaxation over the items not yet decided, computed in
+    O(log n) from prefix sums over the ratio-sorted items.
+
+    :param weights: List of item weights.
+    :param profits: List of item profits.
+    :param capacity: Knapsack capacity.
+    :param max_nodes: Optional limit on the number of nodes expanded.
+    :param time_limit: Optional limit on the search time in seconds.
+    :return: (max_profit, items_selected, proven_optimal). If a budget runs out
+             the best incumbent found so far is returned with proven_optimal False.
+    """
+    if len(weights) != len(profits):
+        raise ValueError("The number of weights and profits must be the same.")
+
+    # Zero-weight items with positive profit are always worth taking
+    base_items = [i for i in range(len(weights)) if weights[i] == 0 and profits[i] > 0]
+    base_profit = sum(profits[i] for i in base_items)
+
+    # Branch on the remaining items in decreasing profit/weight order, which
+    # keeps the suffix relaxation tight and finds good incumbents early
+    order = sorted((i for i in range(len(weights)) if 0 < weights[i] <= capacity and profits[i] > 0),
+                   key=lambda i: profits[i] / weights[i], reverse=True)
+    order_weights = [weights[i] for i in order]
+    order_profits = [profits[i] for i in order]
+    n = len(order)
+
+    # prefix_weights[k] / prefix_profits[k]: totals of the first k sorted items
+    prefix_weights = [0]
+    prefix_profits = [0]
+    for depth in range(n):
+        prefix_weights.append(prefix_weights[-1] + order_weights[depth])
+        prefix_profits.append(prefix_profits[-1] + order_profits[depth])
+
+    def relaxation(depth, remaining):
+        # Fractional knapsack over items depth..n-1: whole items up to the
+        # break item found by binary search, then a fraction of that item
+        stop = bisect_right(prefix_weights, prefix_weights[depth] + remaining, depth) - 1
+        bound = prefix_profits[stop] - prefix_profits[depth]
+        if stop < n:
+            left = remaining - (prefix_weights[stop] - prefix_weights[depth])
+            bound += left * order_profits[stop] / order_weights[stop]
+        return bound
+
+    # Seed the incumbent with the greedy integer solution
+    best_profit = 0
+    best_taken = []
+    remaining = capacity
+    for depth in range(n):
+        if order_weights[depth] <= remaining:
+            remaining -= order_weights[depth]
+            best_profit += order_profits[depth]
+            best_taken.append(depth)
+
+    deadline = None if time_limit is None else time.perf_counter() + time_limit
+    nodes = 0
+    proven_optimal = True
+
+    # Stack entries: (depth, profit so far, remaining capacity, taken depths)
+    stack = [(0, 0, capacity, ())]
+    while stack:
+        if (max_nodes is not None and nodes >= max_nodes) or \
+                (deadline is not None and time.perf_counter() >= deadline):
+            proven_optimal = False
+            break
+        depth, profit, remaining, taken = stack.pop()
+        nodes += 1
+
+        if profit > best_profit:
+            best_profit = profit
+            best_taken = list(taken)
+        if depth == n:
+            continue
+
+        if profit + relaxation(depth, remaining) <= best_profit:
+            continue
+
+        # Push the exclude branch first so the include branch is explored first
+        stack.append((depth + 1, profit, remaining, taken))
+        if order_weights[depth] <= remaining:
+            stack.append((depth + 1, profit + order_profits[depth],
+                          remaining - order_weights[depth], taken + (depth,)))
+
+    items_selected = sorted(base_items + [order[depth] for depth in best_taken])
+
+    return base_profit + best_profit, items_selected, proven_optimal
 
 
 def print_knapsack_solution(weights, profits, capacity):
@@ -40,41 +333,34 @@ def print_knapsack_solution(weights, profits, capacity):
 
     dp_table, max_profit, items = knapsack(weights, profits, capacity)
 
-    # Output DP table
-    try:
-        from tabulate import tabulate
-        use_tabulate = True
-    except ImportError:
-        use_tabulate = False
-
     n = len(weights)
-    headers = [Fore.YELLOW + 'Item\\Capacity' + Style.RESET_ALL] + [Fore.YELLOW + str(i) + Style.RESET_ALL for i in
-                                                                    range(capacity + 1)]
-    table = []
-    for i in range(n + 1):
-        if i == 0:
-            row_label = Fore.CYAN + "0" + Style.RESET_ALL
-        else:
-            row_label = Fore.CYAN + f"Item {i} (W={weights[i - 1]}, P={profits[i - 1]})" + Style.RESET_ALL
-        row = [row_label]
-        for w in range(capacity + 1):
-            cell_value = dp_table[i][w]
-            if i > 0 and w == capacity and cell_value == max_profit:
-                # Highlight the cell that contains the maximum profit
-                row.append(Fore.GREEN + str(cell_value) + Style.RESET_ALL)
+
+    # Column 0 holds the row label, column j > 0 holds capacity j - 1
+    def get_header(j):
+        return 'Item\\Capacity' if j == 0 else str(j - 1)
+
+    def get_row(i, columns):
+        row = []
+        for j in columns:
+            if j > 0:
+                row.append(str(dp_table[i][j - 1]))
+            elif i == 0:
+                row.append("0")
             else:
-                row.append(str(cell_value))
-        table.append(row)
+                row.append(f"Item {i} (W={weights[i - 1]}, P={profits[i - 1]})")
+        return row
 
+    def style(i, j):
+        if j == 0:
+            return Fore.CYAN
+        if i > 0 and j - 1 == capacity and dp_table[i][capacity] == max_profit:
+            # Highlight the cell that contains the maximum profit
+            return Fore.GREEN
+        return None
+
+    # Output DP table
     print(Fore.YELLOW + "\nDynamic Programming Table:" + Style.RESET_ALL)
-    if use_tabulate:
-        print(tabulate(table, headers=headers, tablefmt="pretty"))
-    else:
-        # Fallback if tabulate is not installed
-        header_row = "".join(f"{str(h):>5}" for h in headers)
-        print(header_row)
-        for row in table:
-            print("".join(f"{str(item):>5}" for item in row))
+    render_table(n + 1, capacity + 2, get_row, get_header, style, fallback_width=5, fallback_align=">")
 
     print(Fore.GREEN + f"\nMaximum Profit: {max_profit}" + Style.RESET_ALL)
     print(Fore.BLUE + "\nItems selected:" + Style.RESET_ALL)
@@ -91,21 +377,9 @@ def print_excel_format(weights, profits, capacity):
         return
 
     dp_table, max_profit, items = knapsack(weights, profits, capacity)
-    n = len(weights)
-
-    # Print headers with tab separation for Excel
-    print("Capacity\t" + "\t".join(str(i) for i in range(capacity + 1)))
 
-    # Print each row with item information and values
-    for i in range(n + 1):
-        if i == 0:
-            row_label = "Initial"
-        else:
-            row_label = f"Item {i} (W={weights[i - 1]}, P={profits[i - 1]})"
-
-        # Print row with tab separation
-        row_values = "\t".join(str(dp_table[i][w]) for w in range(capacity + 1))
-        print(f"{row_label}\t{row_values}")
+    # Stream the table with tab separation for Excel
+    write_knapsack_table(weights, profits, capacity, dp_table, sys.stdout)
 
     # Print summary information
     print("\nSolution Summary")
@@ -118,6 +392,37 @@ def print_excel_format(weights, profits, capacity):
     print(f"Total Weight:\t{total_weight}")
 
 
+def benchmark_knapsack(sizes=((50, 1000), (100, 10000), (200, 20000)), repeat=3, seed=0):
+    # Compare the pure-Python table loop against the NumPy row updates
+    rng = random.Random(seed)
+    print(f"{'n':>6}{'capacity':>10}{'python (s)':>14}{'numpy (s)':>14}{'speedup':>10}")
+    for n, capacity in sizes:
+        weights = [rng.randint(1, max(1, capacity // 4)) for _ in range(n)]
+        profits = [rng.randint(1, 1000) for _ in range(n)]
+        timings = {}
+        for backend in ("python", "numpy"):
+            best = float('inf')
+            for _ in range(repeat):
+                start = time.perf_counter()
+                _, max_profit, _ = knapsack(weights, profits, capacity, backend=backend)
+                best = min(best, time.perf_counter() - start)
+            timings[backend] = (best, max_profit)
+        assert timings["python"][1] == timings["numpy"][1]
+        py_time, np_time = timings["python"][0], timings["numpy"][0]
+        print(f"{n:>6}{capacity:>10}{py_time:>14.4f}{np_time:>14.4f}{py_time / np_time:>9.1f}x")
+
+
+def write_knapsack_table(weights, profits, capacity, dp_table, out, fmt="tsv", rows=None, columns=None):
+    # Stream the DP table to a file path or buffer without printing it
+    def row_label(i):
+        if i == 0:
+            return "Initial"
+        return f"Item {i} (W={weights[i - 1]}, P={profits[i - 1]})"
+
+    return write_dp_table(dp_table, out, row_label, range(capacity + 1), corner="Capacity",
+                          fmt=fmt, rows=rows, columns=columns)
+
+
 def print_colored_and_excel(weights, profits, capacity):
     # Print both colored console output and Excel-compatible format
     print("=" * 50)
@@ -133,6 +438,10 @@ def print_colored_and_excel(weights, profits, capacity):
 
 
 if __name__ == "__main__":
+    if "--benchmark" in sys.argv:
+        benchmark_knapsack()
+        sys.exit()
+
     # Define your weights, profits, and capacity here
     weights = [1, 2, 3, 5]
     profits = [1, 6, 10, 16]
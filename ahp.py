@@ -1,5 +1,4 @@
 import numpy as np
-import pandas as pd
 
 # Pairwise comparison matrix (criteria for overall items)
 criteria = [
@@ -18,13 +17,107 @@ criteria_labels = [
     "Thermostat", "Mobile App Access", "Voice Assistant Integration"
 ]
 
+# Functional Requirements (FR) Matrix
+fr_matrix = [
+    [1, 3, 3, 7, 7, 5, 5, 5],  # Live video feed access
+    [0.33, 1, 1, 5, 5, 3, 3, 3],  # Motion detection alerts
+    [0.33, 1, 1, 5, 5, 3, 3, 3],  # Video recording and storage
+    [0.14, 0.2, 0.2, 1, 1, 0.33, 0.33, 0.33],  # Video intercom functionality
+    [0.14, 0.2, 0.2, 1, 1, 0.33, 0.33, 0.33],  # Remote answering capability
+    [0.2, 0.33, 0.33, 3, 3, 1, 1, 1],  # Remote control capabilities
+    [0.2, 0.33, 0.33, 3, 3, 1, 1, 1],  # Scheduling functionality
+    [0.2, 0.33, 0.33, 3, 3, 1, 1, 1],  # Integration with motion sensors
+]
 
-# Function to calculate priority vector and format outputs for Excel
-def calculate_ahp(matrix, labels):
+# Labels for FR items
+fr_labels = [
+    "Live video feed access",
+    "Motion detection alerts",
+    "Video recording and storage",
+    "Video intercom functionality",
+    "Remote answering capability",
+    "Remote control capabilities",
+    "Scheduling functionality",
+    "Integration with motion sensors"
+]
+
+# Non-Functional Requirements (NFR) Matrix
+nfr_matrix = [
+    [1, 5, 7, 3, 8],  # High-quality video streaming
+    [0.2, 1, 3, 0.33, 4],  # Reliable connectivity
+    [0.14, 0.33, 1, 0.2, 2],  # Quick response time
+    [0.33, 3, 5, 1, 6],  # App response time under 3 seconds
+    [0.125, 0.25, 0.5, 0.17, 1],  # 99.9% app uptime and reliability
+]
+
+# Labels for NFR items
+nfr_labels = [
+    "High-quality video streaming",
+    "Reliable connectivity",
+    "Quick response time",
+    "App response time under 3 seconds",
+    "99.9% app uptime and reliability"
+]
+
+
+# Core math: column-normalize the matrix and average each row
+def ahp_column_average(matrix):
     matrix = np.array(matrix)
     column_sums = matrix.sum(axis=0)
     normalized_matrix = matrix / column_sums
     priority_vector = normalized_matrix.mean(axis=1)
+    return matrix, column_sums, normalized_matrix, priority_vector
+
+
+def _print_tab_separated(index_label, column_labels, row_labels, rows):
+    print("\t".join([index_label] + list(column_labels)))
+    for label, row in zip(row_labels, rows):
+        print("\t".join([label] + [str(value) for value in row]))
+
+
+def _print_ahp_plain(matrix, labels, column_sums, normalized_matrix, priority_vector):
+    # Report used when pandas is not installed
+    print("\nPairwise Comparison Matrix:")
+    _print_tab_separated("", labels, labels, matrix)
+    print("\nColumn Sums:")
+    _print_tab_separated("", labels, ["Column Sums"], [column_sums])
+    print("\nNormalized Matrix:")
+    _print_tab_separated("", labels, labels, np.round(normalized_matrix, 4))
+    print("\nPriority Vector (Weights):")
+    for i, weight in enumerate(priority_vector):
+        print(f"{labels[i]}: {weight:.4f}")
+
+    # Same sections as the pandas report, each followed by a blank line like to_csv output
+    print("\nExcel Friendly Output - Pairwise Comparison Matrix:\n")
+    _print_tab_separated("", labels, labels, matrix)
+    print()
+    print("\nExcel Friendly Output - Column Sums:\n")
+    _print_tab_separated("", labels, ["Column Sums"], [column_sums])
+    print()
+    print("\nExcel Friendly Output - Normalized Matrix:\n")
+    _print_tab_separated("", labels, labels, normalized_matrix)
+    print()
+    print("\nExcel Friendly Output - Priority Vector:\n")
+    print("Item\tWeight")
+    for label, weight in zip(labels, priority_vector):
+        print(f"{label}\t{weight}")
+    print()
+
+
+# Function to calculate priority vector and format outputs for Excel.
+# Always returns the NumPy arrays from ahp_column_average; pandas is only
+# used for the printed report.
+def calculate_ahp(matrix, labels):
+    result = ahp_column_average(matrix)
+    matrix, column_sums, normalized_matrix, priority_vector = result
+
+    # pandas is only needed for the DataFrame/Excel formatting, so it is
+    # imported here and is optional
+    try:
+        import pandas as pd
+    except ImportError:
+        _print_ahp_plain(matrix, labels, column_sums, normalized_matrix, priority_vector)
+        return result
 
     # Prepare DataFrames for Excel output
     pairwise_df = pd.DataFrame(matrix, index=labels, columns=labels)
@@ -58,58 +151,172 @@ def calculate_ahp(matrix, labels):
     print("\nExcel Friendly Output - Priority Vector:\n")
     print(priority_vector_excel_str)
 
-    return pairwise_df, column_sums_df, normalized_df, priority_vector_df
+    return result
 
 
-# Calculate priority vector for the criteria matrix
-print("Criteria Matrix (Overall Requirements):")
-criteria_pairwise_df, criteria_column_sums_df, criteria_normalized_df, criteria_priority_vector_df = calculate_ahp(
-    criteria, criteria_labels)
+# Saaty's random consistency index, indexed by matrix size
+RANDOM_INDEX = [0.0, 0.0, 0.0, 0.58, 0.90, 1.12, 1.24, 1.32, 1.41, 1.45, 1.49, 1.51, 1.48, 1.56, 1.57, 1.59]
 
-# Functional Requirements (FR) Matrix
-fr_matrix = [
-    [1, 3, 3, 7, 7, 5, 5, 5],  # Live video feed access
-    [0.33, 1, 1, 5, 5, 3, 3, 3],  # Motion detection alerts
-    [0.33, 1, 1, 5, 5, 3, 3, 3],  # Video recording and storage
-    [0.14, 0.2, 0.2, 1, 1, 0.33, 0.33, 0.33],  # Video intercom functionality
-    [0.14, 0.2, 0.2, 1, 1, 0.33, 0.33, 0.33],  # Remote answering capability
-    [0.2, 0.33, 0.33, 3, 3, 1, 1, 1],  # Remote control capabilities
-    [0.2, 0.33, 0.33, 3, 3, 1, 1, 1],  # Scheduling functionality
-    [0.2, 0.33, 0.33, 3, 3, 1, 1, 1],  # Integration with motion sensors
-]
 
-# Labels for FR items
-fr_labels = [
-    "Live video feed access",
-    "Motion detection alerts",
-    "Video recording and storage",
-    "Video intercom functionality",
-    "Remote answering capability",
-    "Remote control capabilities",
-    "Scheduling functionality",
-    "Integration with motion sensors"
-]
+def ahp_priorities(matrices, tol=1e-10, max_iter=1000):
+    """
+    Compute-only AHP: principal-eigenvector priorities and consistency.
 
-print("\nFunctional Requirements (FR) Matrix:")
-fr_pairwise_df, fr_column_sums_df, fr_normalized_df, fr_priority_vector_df = calculate_ahp(fr_matrix, fr_labels)
+    Accepts a single n x n comparison matrix or a stacked k x n x n array and
+    runs power iteration on the whole stack at once, so many matrices are
+    processed in one batched NumPy call. Nothing is printed and no DataFrames
+    are built.
 
-# Non-Functional Requirements (NFR) Matrix
-nfr_matrix = [
-    [1, 5, 7, 3, 8],  # High-quality video streaming
-    [0.2, 1, 3, 0.33, 4],  # Reliable connectivity
-    [0.14, 0.33, 1, 0.2, 2],  # Quick response time
-    [0.33, 3, 5, 1, 6],  # App response time under 3 seconds
-    [0.125, 0.25, 0.5, 0.17, 1],  # 99.9% app uptime and reliability
-]
+    :param matrices: An n x n matrix or a k x n x n stack of matrices.
+    :param tol: Convergence tolerance on the change of the priority vectors.
+    :param max_iter: Maximum number of power iterations.
+    :return: (priorities, lambda_max, ci, cr). For a stack, priorities has
+             shape (k, n) and the other values have shape (k,).
+    """
+    matrices = np.asarray(matrices, dtype=float)
+    single = matrices.ndim == 2
+    if single:
+        matrices = matrices[np.newaxis]
+    k, n, _ = matrices.shape
+    if k == 0:
+        return np.empty((0, n)), np.empty(0), np.empty(0), np.empty(0)
+
+    # Power iteration, normalizing each vector to sum to one
+    priorities = np.full((k, n), 1.0 / n)
+    for _ in range(max_iter):
+        updated = np.einsum('kij,kj->ki', matrices, priorities)
+        updated /= updated.sum(axis=1, keepdims=True)
+        converged = np.abs(updated - priorities).max() < tol
+        priorities = updated
+        if converged:
+            break
+
+    # With priorities summing to one, A w = lambda_max w sums to lambda_max
+    lambda_max = np.einsum('kij,kj->k', matrices, priorities)
+    ci = (lambda_max - n) / (n - 1) if n > 1 else np.zeros(k)
+    ri = RANDOM_INDEX[n] if n < len(RANDOM_INDEX) else RANDOM_INDEX[-1]
+    cr = ci / ri if ri > 0 else np.zeros(k)
+
+    if single:
+        return priorities[0], float(lambda_max[0]), float(ci[0]), float(cr[0])
+    return priorities, lambda_max, ci, cr
+
+
+class AHPNode:
+    """
+    One comparison matrix in an AHP hierarchy.
+
+    children maps some of the labels to the AHPNode that breaks that label
+    down further; labels without a child are leaves of the hierarchy.
+    """
+
+    def __init__(self, matrix, labels, children=None):
+        self.matrix = np.asarray(matrix, dtype=float)
+        self.labels = list(labels)
+        self.children = dict(children or {})
+        if self.matrix.shape != (len(self.labels), len(self.labels)):
+            raise ValueError("Comparison matrix must be square with one row per label")
+        unknown = set(self.children) - set(self.labels)
+        if unknown:
+            raise ValueError(f"Children given for unknown labels: {sorted(unknown)}")
+        self.parent = None
+        for child in self.children.values():
+            child.parent = self
+        # Cached results: local (priorities, lambda_max, ci, cr) and the
+        # weights of the leaves below this node, relative to this node
+        self._local = None
+        self._leaf_weights = None
+
+    def _invalidate(self):
+        self._local = None
+        node = self
+        while node is not None:
+            node._leaf_weights = None
+            node = node.parent
+
+
+class AHPHierarchy:
+    """
+    AHP hierarchy that composes local priorities into global leaf weights.
+
+    All stale local priorities are computed together, one batched
+    ahp_priorities call per matrix size. Results are cached per node, so
+    editing one matrix recomputes only that node's eigenvector and the leaf
+    weights on its path to the root.
+    """
+
+    def __init__(self, root):
+        self.root = root
+
+    def _nodes(self):
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(node.children.values())
+
+    def node(self, path=()):
+        # Path is the sequence of labels leading from the root to the node
+        node = self.root
+        for label in path:
+            node = node.children[label]
+        return node
+
+    def set_matrix(self, path, matrix):
+        node = self.node(path)
+        matrix = np.asarray(matrix, dtype=float)
+        if matrix.shape != node.matrix.shape:
+            raise ValueError("Replacement matrix must have the same shape")
+        node.matrix = matrix
+        node._invalidate()
+
+    def compute(self):
+        # Group all stale nodes by matrix size and solve each group in one call
+        stale = {}
+        for node in self._nodes():
+            if node._local is None:
+                stale.setdefault(len(node.labels), []).append(node)
+        for nodes in stale.values():
+            priorities, lambda_max, ci, cr = ahp_priorities(np.stack([node.matrix for node in nodes]))
+            for idx, node in enumerate(nodes):
+                node._local = (priorities[idx], lambda_max[idx], ci[idx], cr[idx])
+
+    def local_priorities(self, path=()):
+        self.compute()
+        return self.node(path)._local
+
+    def _leaf_weights(self, node):
+        if node._leaf_weights is None:
+            weights = {}
+            for label, weight in zip(node.labels, node._local[0]):
+                child = node.children.get(label)
+                if child is None:
+                    weights[(label,)] = float(weight)
+                else:
+                    for leaf, leaf_weight in self._leaf_weights(child).items():
+                        weights[(label,) + leaf] = float(weight * leaf_weight)
+            node._leaf_weights = weights
+        return node._leaf_weights
+
+    def global_weights(self):
+        """
+        :return: Dictionary mapping each leaf path (tuple of labels) to its global weight.
+        """
+        self.compute()
+        return dict(self._leaf_weights(self.root))
+
+
+def main():
+    # Calculate priority vector for the criteria matrix
+    print("Criteria Matrix (Overall Requirements):")
+    calculate_ahp(criteria, criteria_labels)
+
+    print("\nFunctional Requirements (FR) Matrix:")
+    calculate_ahp(fr_matrix, fr_labels)
+
+    print("\nNon-Functional Requirements (NFR) Matrix:")
+    calculate_ahp(nfr_matrix, nfr_labels)
 
-# Labels for NFR items
-nfr_labels = [
-    "High-quality video streaming",
-    "Reliable connectivity",
-    "Quick response time",
-    "App response time under 3 seconds",
-    "99.9% app uptime and reliability"
-]
 
-print("\nNon-Functional Requirements (NFR) Matrix:")
-nfr_pairwise_df, nfr_column_sums_df, nfr_normalized_df, nfr_priority_vector_df = calculate_ahp(nfr_matrix, nfr_labels)
+if __name__ == "__main__":
+    main()
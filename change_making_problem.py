@@ -1,5 +1,17 @@
+import os
+import random
+import sys
+from array import array
+from collections import OrderedDict
+
+import numpy as np
 from colorama import init, Fore, Style
 
+from table_render import render_table, alternating_row_style
+
+# Marks amounts that cannot be made in the compact dp array
+NO_SOLUTION = -1
+
 def change_making(coins, amount):
     init(autoreset=True)  # Initialize colorama
 
@@ -32,57 +44,384 @@ def change_making(coins, amount):
     else:
         return dp, coin_used, calculations, dp[amount]
 
+def change_making_compact(coins, amount):
+    """
+    Compute-only change making with no per-cell string building.
+
+    dp and coin_used are stored as compact signed 64-bit integer arrays;
+    dp[x] is NO_SOLUTION when x cannot be made. Use change_making_calculation
+    to produce the calculation text for the amounts that are displayed.
+
+    :param coins: List of coin denominations.
+    :param amount: Target amount.
+    :return: (dp, coin_used, min_coins) with min_coins None if there is no solution.
+    """
+    dp = array('q', [0])
+    coin_used = array('q', [0])
+    _extend_change_table(coins, dp, coin_used, amount)
+
+    min_coins = dp[amount] if dp[amount] != NO_SOLUTION else None
+    return dp, coin_used, min_coins
+
+def _extend_change_table(coins, dp, coin_used, amount):
+    # Append entries to the compact dp/coin_used arrays until they cover amount
+    start = len(dp)
+    if amount < start:
+        return
+    dp.extend(array('q', [NO_SOLUTION]) * (amount + 1 - start))
+    coin_used.extend(array('q', [0]) * (amount + 1 - start))
+
+    for x in range(start, amount + 1):
+        best = NO_SOLUTION
+        used_coin = 0
+        for coin in coins:
+            if coin <= x:
+                count = dp[x - coin]
+                if count != NO_SOLUTION and (best == NO_SOLUTION or count < best):
+                    best = count
+                    used_coin = coin
+        if best != NO_SOLUTION:
+            dp[x] = best + 1
+            coin_used[x] = used_coin
+
+def _greedy_counts(coins_desc, amount):
+    # Number of each coin (largest first) the greedy algorithm takes
+    counts = []
+    for coin in coins_desc:
+        counts.append(amount // coin)
+        amount %= coin
+    return counts
+
+def find_greedy_counterexample(coins):
+    """
+    Smallest amount for which greedy change is not optimal, or None.
+
+    Uses Pearson's O(n^3) test: the minimal counterexample, if any, is among
+    the candidates built from the greedy representation of c[i-1] - 1 by
+    keeping its first j coins and adding one more coin j. This replaces a
+    scan of the whole Kozen-Zaks window c3 + 1 < x < c1 + c2 (coins in
+    decreasing order) with O(n^2) candidates. Coin systems without a 1 are
+    reported by is_canonical as not canonical instead.
+
+    :param coins: List of coin denominations.
+    :return: The smallest counterexample amount, or None if greedy is optimal.
+    """
+    coins_desc = sorted(set(coins), reverse=True)
+    n = len(coins_desc)
+    smallest = None
+    for i in range(1, n):
+        greedy = _greedy_counts(coins_desc, coins_desc[i - 1] - 1)
+        for j in range(i, n):
+            candidate = greedy[:j] + [greedy[j] + 1] + [0] * (n - j - 1)
+            amount = sum(count * coin for count, coin in zip(candidate, coins_desc))
+            if sum(_greedy_counts(coins_desc, amount)) > sum(candidate):
+                if smallest is None or amount < smallest:
+                    smallest = amount
+    return smallest
+
+def is_canonical(coins):
+    # Greedy change is optimal for every amount
+    return 1 in coins and find_greedy_counterexample(coins) is None
+
+def greedy_change(coins, amount):
+    # O(#coins) greedy change, largest coins first
+    coins_desc = sorted(set(coins), reverse=True)
+    coin_list = []
+    for coin, count in zip(coins_desc, _greedy_counts(coins_desc, amount)):
+        coin_list.extend([coin] * count)
+    return coin_list
+
+def change_making_auto(coins, amount):
+    """
+    Minimum-coin change that uses greedy when it is provably optimal.
+
+    :return: (min_coins, coin_list, method) where method is "greedy" or "dp";
+             min_coins and coin_list are None if there is no solution.
+    """
+    return ChangeMakingSolver.for_coins(coins).solve(amount)
+
+def periodic_bound(coins):
+    """
+    Amount above which every optimal solution uses the largest coin.
+
+    An optimal solution holds fewer than c_max coins other than the largest
+    one c_max: among any c_max of them some non-empty subset sums to a
+    multiple of c_max and could be swapped for fewer largest coins. Those
+    coins are each at most the second largest coin c_2, so for
+    x > (c_max - 1) * c_2 we have F[x] = F[x - c_max] + 1, and x is reachable
+    exactly when x - c_max is.
+    """
+    coins = sorted(set(coins))
+    if len(coins) < 2:
+        return 0
+    return (coins[-1] - 1) * coins[-2]
+
+def change_making_large(coins, amount):
+    """
+    Minimum-coin change for huge amounts without a table of size amount.
+
+    The DP is only built up to periodic_bound(coins) + largest coin; the rest
+    of the amount is paid with the largest coin.
+
+    :return: (min_coins, coin_counts) where coin_counts maps each coin to how
+             many times it is used, or (None, None) if there is no solution.
+    """
+    solver = ChangeMakingSolver.for_coins(coins)
+    return solver.min_coins(amount), solver.coin_counts(amount)
+
+class ChangeMakingSolver:
+    """
+    Reusable change-making table for one coin system.
+
+    The table grows only up to the largest amount requested so far, and
+    queries for amounts already covered cost O(answer length). Use
+    for_coins() to share one solver per coin set, and save()/load() to keep
+    the table on disk and memory-map it for fast warm starts. for_coins()
+    keeps only the max_cached most recently used solvers; callers that need
+    a table to stay alive should hold on to their own instance.
+
+    For canonical coin systems no table is built at all: queries are
+    answered greedily, and method reports which path is used. Otherwise the
+    table never grows past periodic_bound(coins) + largest coin; larger
+    amounts are reduced with the largest coin first.
+    """
+
+    # Shared solvers by coin set, least recently used first
+    _instances = OrderedDict()
+    max_cached = 32
+
+    def __init__(self, coins):
+        self.coins = tuple(sorted(set(coins)))
+        self.dp = array('q', [0])
+        self.coin_used = array('q', [0])
+        self.method = "greedy" if is_canonical(self.coins) else "dp"
+        self.bound = periodic_bound(self.coins)
+
+    @classmethod
+    def for_coins(cls, coins):
+        key = tuple(sorted(set(coins)))
+        if key in cls._instances:
+            cls._instances.move_to_end(key)
+            return cls._instances[key]
+        return cls._remember(cls(key))
+
+    @classmethod
+    def _remember(cls, solver):
+        # Share solver unless one is already cached, evicting the least recently used
+        solver = cls._instances.setdefault(solver.coins, solver)
+        cls._instances.move_to_end(solver.coins)
+        while len(cls._instances) > cls.max_cached:
+            cls._instances.popitem(last=False)
+        return solver
+
+    @property
+    def max_amount(self):
+        return len(self.dp) - 1
+
+    def extend(self, amount):
+        if amount <= self.max_amount:
+            return
+        if not isinstance(self.dp, array):
+            # Loaded tables are read-only memory maps; copy before growing
+            self.dp = array('q', self.dp.tolist())
+            self.coin_used = array('q', self.coin_used.tolist())
+        _extend_change_table(self.coins, self.dp, self.coin_used, amount)
+
+    def _reduce(self, amount):
+        # Split amount into a table-sized remainder plus a number of largest
+        # coins; every step removed is above the periodic bound
+        if not self.coins:
+            return amount, 0
+        largest = self.coins[-1]
+        if amount < self.bound + largest:
+            return amount, 0
+        extra = (amount - self.bound) // largest
+        return amount - extra * largest, extra
+
+    def min_coins(self, amount):
+        if self.method == "greedy":
+            coins_desc = self.coins[::-1]
+            return sum(_greedy_counts(coins_desc, amount))
+        remainder, extra = self._reduce(amount)
+        self.extend(remainder)
+        count = int(self.dp[remainder])
+        return count + extra if count != NO_SOLUTION else None
+
+    def _table_coins(self, amount):
+        coin_list = []
+        k = amount
+        while k > 0:
+            coin = int(self.coin_used[k])
+            coin_list.append(coin)
+            k -= coin
+        coin_list.reverse()
+        return coin_list
+
+    def coin_list(self, amount):
+        if self.method == "greedy":
+            return greedy_change(self.coins, amount)
+        if self.min_coins(amount) is None:
+            return None
+        remainder, extra = self._reduce(amount)
+        return self._table_coins(remainder) + [self.coins[-1]] * extra
+
+    def coin_counts(self, amount):
+        # Like coin_list, but as {coin: count} so huge amounts stay compact
+        if self.method == "greedy":
+            coins_desc = self.coins[::-1]
+            return {coin: count for coin, count in zip(coins_desc, _greedy_counts(coins_desc, amount)) if count}
+        if self.min_coins(amount) is None:
+            return None
+        remainder, extra = self._reduce(amount)
+        counts = {}
+        for coin in self._table_coins(remainder):
+            counts[coin] = counts.get(coin, 0) + 1
+        if extra:
+            counts[self.coins[-1]] = counts.get(self.coins[-1], 0) + extra
+        return counts
+
+    def solve(self, amount):
+        coin_list = self.coin_list(amount)
+        min_coins = len(coin_list) if coin_list is not None else None
+        return min_coins, coin_list, self.method
+
+    def save(self, path):
+        # Table as one .npy file (row 0: dp, row 1: coin_used), coins alongside.
+        # The table is copied into memory and written to a temporary file that
+        # replaces path, since self.dp may be memory-mapped from path itself.
+        table = np.array([self.dp, self.coin_used], dtype=np.int64)
+        with open(path + ".tmp", "wb") as f:
+            np.save(f, table)
+        os.replace(path + ".tmp", path)
+        with open(path + ".coins", "w") as f:
+            f.write(",".join(map(str, self.coins)))
+
+    @classmethod
+    def load(cls, path):
+        with open(path + ".coins") as f:
+            coins = [int(coin) for coin in f.read().split(",") if coin.strip()]
+        solver = cls(coins)
+        table = np.load(path, mmap_mode='r')
+        solver.dp, solver.coin_used = table[0], table[1]
+        cls._remember(solver)
+        return solver
+
+def change_making_calculation(coins, dp, x):
+    # Rebuild the calculation text that change_making() stores for amount x
+    if x == 0:
+        return ''
+    calc_steps = [f"F[{x} - {coin}] = F[{x - coin}]" for coin in coins if x >= coin]
+    if dp[x] == NO_SOLUTION:
+        return f"F[{x}] remains inf"
+    return f"F[{x}] = min{{" + ', '.join(calc_steps) + f"}} + 1 = {dp[x]}"
+
+def count_change_ways(coins, amount, modulus=None):
+    """
+    Number of ways to make amount with unlimited coins (order does not matter).
+
+    Uses one O(amount) row. Counts are exact Python big integers unless a
+    modulus is given, in which case they are reduced modulo it.
+    """
+    ways = [0] * (amount + 1)
+    ways[0] = 1 if modulus is None else 1 % modulus
+    for coin in sorted(set(coins)):
+        if coin <= 0:
+            continue
+        for x in range(coin, amount + 1):
+            ways[x] += ways[x - coin]
+            if modulus is not None:
+                ways[x] %= modulus
+    return ways[amount]
+
+def change_making_bounded(coins, quantities, amount):
+    """
+    Minimum-coin change when each denomination has a limited quantity.
+
+    Each quantity is split into binary pieces 1, 2, 4, ..., rest, so a coin
+    with stock q becomes O(log q) 0/1 items and large stock counts stay
+    fast. The DP keeps one O(amount) row plus a provenance chain per amount,
+    (coin, pieces, previous_entry), whose tails are shared between amounts.
+
+    :param coins: List of coin denominations.
+    :param quantities: Number of coins available for each denomination.
+    :param amount: Target amount.
+    :return: (min_coins, coin_counts) with coin_counts mapping coin -> count,
+             or (None, None) if the amount cannot be made.
+    """
+    if len(coins) != len(quantities):
+        raise ValueError("The number of coins and quantities must be the same.")
+
+    max_value = float('inf')
+    dp = [0] + [max_value] * amount
+    chain = [None] * (amount + 1)
+
+    for coin, quantity in zip(coins, quantities):
+        if coin <= 0:
+            continue
+        # No more than amount // coin of this coin can ever be used
+        remaining = min(quantity, amount // coin)
+        piece = 1
+        while remaining > 0:
+            count = min(piece, remaining)
+            remaining -= count
+            piece *= 2
+            weight = coin * count
+            for x in range(amount, weight - 1, -1):
+                candidate = dp[x - weight] + count
+                if candidate < dp[x]:
+                    dp[x] = candidate
+                    chain[x] = (coin, count, chain[x - weight])
+
+    if dp[amount] == max_value:
+        return None, None
+    coin_counts = {}
+    entry = chain[amount]
+    while entry is not None:
+        coin, count, entry = entry
+        coin_counts[coin] = coin_counts.get(coin, 0) + count
+    return dp[amount], coin_counts
+
+def check_large_amounts(trials=200, max_amount=2000, seed=0):
+    # Property check: the periodic large-amount mode matches the full DP
+    rng = random.Random(seed)
+    for _ in range(trials):
+        coins = rng.sample(range(1, 40), rng.randint(1, 5))
+        amount = rng.randint(0, max_amount)
+        _, _, expected = change_making_compact(coins, amount)
+        solver = ChangeMakingSolver(coins)
+        solver.method = "dp"  # exercise the bounded table even for canonical sets
+        min_coins, coin_counts = solver.min_coins(amount), solver.coin_counts(amount)
+        assert min_coins == expected, (coins, amount, min_coins, expected)
+        if expected is not None:
+            assert sum(coin * count for coin, count in coin_counts.items()) == amount
+            assert sum(coin_counts.values()) == expected
+            assert solver.max_amount < solver.bound + max(coins)
+    print(f"Large-amount mode matched the full DP on {trials} random coin sets")
+
 def print_change_making_solution(coins, amount):
     init(autoreset=True)  # Initialize colorama
 
-    dp, coin_used, calculations, min_coins = change_making(coins, amount)
+    dp, coin_used, min_coins = change_making_compact(coins, amount)
 
     if min_coins is None:
         print(Fore.RED + f"No solution possible to make amount {amount} with given coins." + Style.RESET_ALL)
         return
 
-    # Prepare data for the table
-    table_data = []
-    for i in range(amount + 1):
-        # Alternate row colors
-        if i % 2 == 0:
-            row_color = Fore.LIGHTMAGENTA_EX
-        else:
-            row_color = Fore.CYAN
+    # Rows are built only for the amounts that end up displayed
+    headers = ["Amount", "Min Coins", "Last Coin Used", "Calculation"]
+
+    def get_row(i, columns):
         coin_str = str(coin_used[i]) if coin_used[i] != 0 else '-'
-        dp_str = str(dp[i]) if dp[i] != float('inf') else '∞'
-        table_data.append([
-            row_color + str(i) + Style.RESET_ALL,
-            row_color + dp_str + Style.RESET_ALL,
-            row_color + coin_str + Style.RESET_ALL,
-            row_color + calculations[i] + Style.RESET_ALL,
-        ])
-
-    headers = [
-        Fore.YELLOW + "Amount" + Style.RESET_ALL,
-        Fore.YELLOW + "Min Coins" + Style.RESET_ALL,
-        Fore.YELLOW + "Last Coin Used" + Style.RESET_ALL,
-        Fore.YELLOW + "Calculation" + Style.RESET_ALL,
-    ]
+        dp_str = str(dp[i]) if dp[i] != NO_SOLUTION else '∞'
+        row = [str(i), dp_str, coin_str, change_making_calculation(coins, dp, i)]
+        return [row[j] for j in columns]
 
     print(Fore.YELLOW + "\nChange-Making Problem Solution:" + Style.RESET_ALL)
     print(Fore.GREEN + f"Minimum Coins Needed for Amount {amount}: {min_coins}" + Style.RESET_ALL)
     print(Fore.BLUE + "\nDP Table with Calculations:" + Style.RESET_ALL)
 
-    try:
-        from tabulate import tabulate
-        use_tabulate = True
-    except ImportError:
-        use_tabulate = False
-
-    if use_tabulate:
-        print(tabulate(table_data, headers=headers, tablefmt="pretty", maxcolwidths=[None, None, None, 50]))
-    else:
-        # Simple print if tabulate is not installed
-        # Print headers
-        print("".join(f"{h:<20}" for h in headers))
-        for row in table_data:
-            print("".join(f"{cell:<20}" for cell in row))
+    render_table(amount + 1, len(headers), get_row, headers.__getitem__, alternating_row_style,
+                 maxcolwidths=[None, None, None, 50])
 
     # Reconstruct the coins used
     print(Fore.BLUE + "\nCoins Used to Make the Amount:" + Style.RESET_ALL)
@@ -98,6 +437,10 @@ def print_change_making_solution(coins, amount):
 
 # Example usage:
 if __name__ == "__main__":
+    if "--check" in sys.argv:
+        check_large_amounts()
+        sys.exit()
+
     # Define your coin denominations and target amount here
     coins = [1, 3, 4]  # Coin denominations
     amount = 6         # Target amount
@@ -1,3 +1,14 @@
+import json
+import mmap
+import os
+import sys
+import time
+import zlib
+from collections import Counter
+from multiprocessing import Pool
+
+import numpy as np
+
 # Define the input string
 text = """
 The answer is as plain as the nose on your face, or the cream in your coffee, or the vowels in your alphabet. The above paragraph is missing the most common letter in the English language: the letter E.
@@ -9,27 +20,246 @@ There’s a reason, in other words, that scribes see composing prose without the
 On the whole, most of the 5 full-time vowels (sorry, “sometimes Y”)  appear more frequently in English than most consonants, with a few exceptions. Anyone who’s spent the evening watching Wheel of Fortune over the years into its 40th season, can tell you the most common consonants—at least, the ones Pat Sajak gives you for free during the final puzzle—are R, S, T L, and N (tellingly, he also throws in the letter E). Oxford’s analysis confirms that Pat is on the money.
 """
 
-# Initialize an empty dictionary to store character frequencies
-char_freq = {}
 
-# Iterate over each character in the text
-for char in text:
-    if char in char_freq:
-        char_freq[char] += 1
-    else:
-        char_freq[char] = 1
-
-# Optionally, sort the dictionary by frequency in descending order
-sorted_char_freq = sorted(char_freq.items(), key=lambda item: item[1], reverse=True)
-
-# Print the character frequencies
-print("Character Frequency in the Provided Text:\n")
-for char, freq in sorted_char_freq:
-    # For better readability, represent newline and space characters explicitly
-    if char == ' ':
-        display_char = "' ' (space)"
-    elif char == '\n':
-        display_char = "'\\n' (newline)"
+def count_chars(text):
+    # Initialize an empty dictionary to store character frequencies
+    char_freq = {}
+
+    # Iterate over each character in the text
+    for char in text:
+        if char in char_freq:
+            char_freq[char] += 1
+        else:
+            char_freq[char] = 1
+    return char_freq
+
+
+def _open_source(source, binary):
+    # Path, "-" for stdin, or an already open file object
+    if source == "-":
+        if binary:
+            return sys.stdin.buffer, False
+        # Decode stdin exactly like a file path (UTF-8, newlines kept) rather
+        # than with the locale settings of sys.stdin; closefd=False leaves
+        # stdin itself open when this wrapper is closed
+        return open(sys.stdin.fileno(), "r", encoding="utf-8", newline="", closefd=False), True
+    if isinstance(source, str):
+        if binary:
+            return open(source, "rb"), True
+        return open(source, "r", encoding="utf-8", newline=""), True
+    return source, False
+
+
+def count_chars_stream(source, mode="text", chunk_size=1 << 20):
+    """
+    Counts character (or byte) frequencies of a file in fixed-size chunks.
+
+    Memory stays constant no matter how large the input is. Text mode reads
+    UTF-8 text without newline translation and gives the same dictionary as
+    count_chars on the whole text, including first-seen key order. Bytes
+    mode builds a 256-bin histogram with np.bincount over a np.frombuffer
+    view of each chunk and returns {byte value: count}.
+
+    :param source: File path, "-" for stdin, or an open file object.
+    :param mode: "text" or "bytes".
+    :param chunk_size: Characters (text) or bytes (bytes mode) read per chunk.
+    :return: Dictionary of frequencies.
+    """
+    if mode not in ("text", "bytes"):
+        raise ValueError(f"Unknown counting mode '{mode}'")
+    binary = mode == "bytes"
+    f, should_close = _open_source(source, binary)
+    try:
+        if binary:
+            histogram = np.zeros(256, dtype=np.int64)
+            while True:
+                chunk = f.read(chunk_size)
+                if not chunk:
+                    break
+                histogram += np.bincount(np.frombuffer(chunk, dtype=np.uint8), minlength=256)
+            return {int(byte): int(histogram[byte]) for byte in np.flatnonzero(histogram)}
+
+        char_freq = Counter()
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            char_freq.update(chunk)
+        return dict(char_freq)
+    finally:
+        if should_close:
+            f.close()
+
+
+def _utf8_boundary(data, offset):
+    # Move offset forward past UTF-8 continuation bytes (0b10xxxxxx) so a
+    # chunk never starts in the middle of a character
+    while offset < len(data) and data[offset] & 0xC0 == 0x80:
+        offset += 1
+    return offset
+
+
+def _count_file_range(args):
+    # Worker: memory-map the file and count one byte range of it, one
+    # sub-block at a time so memory stays bounded by the block size
+    path, start, end, mode, block_size = args
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        if mode == "bytes":
+            histogram = np.zeros(256, dtype=np.int64)
+            for offset in range(start, end, block_size):
+                count = min(block_size, end - offset)
+                histogram += np.bincount(np.frombuffer(data, dtype=np.uint8, count=count, offset=offset),
+                                         minlength=256)
+            return histogram
+
+        char_freq = Counter()
+        offset = start
+        while offset < end:
+            # end is already a character boundary, so this never passes it
+            stop = _utf8_boundary(data, min(offset + block_size, end))
+            char_freq.update(data[offset:stop].decode("utf-8"))
+            offset = stop
+        return char_freq
+
+
+def count_chars_parallel(path, processes=None, mode="text", task_size=32 << 20, block_size=1 << 20):
+    """
+    Counts character (or byte) frequencies of a large file in a process pool.
+
+    The file is memory-mapped and split into tasks of about task_size bytes;
+    in text mode every split point is moved past UTF-8 continuation bytes so
+    no character is cut in two. Each worker maps the file itself and counts
+    its task in block_size pieces, returning a Counter (or a 256-bin
+    histogram in bytes mode), so a worker's memory use depends on the block
+    size and not on the file size. Results arrive through imap and are merged
+    in file order. The output equals count_chars_stream(path, mode).
+
+    :param path: Path of the file to count.
+    :param processes: Number of worker processes, defaults to os.cpu_count().
+    :param mode: "text" or "bytes".
+    :param task_size: Approximate number of bytes handed to a worker per task.
+    :param block_size: Number of bytes a worker decodes or counts at once.
+    :return: (frequencies, throughput in MB/s)
+    """
+    if mode not in ("text", "bytes"):
+        raise ValueError(f"Unknown counting mode '{mode}'")
+    processes = processes or os.cpu_count() or 1
+    start_time = time.perf_counter()
+
+    size = os.path.getsize(path)
+    if size == 0:
+        return {}, 0.0
+
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        bounds = list(range(0, size, task_size)) + [size]
+        if mode == "text":
+            bounds = [_utf8_boundary(data, offset) for offset in bounds]
+    tasks = [(path, bounds[t], bounds[t + 1], mode, block_size)
+             for t in range(len(bounds) - 1) if bounds[t] < bounds[t + 1]]
+
+    with Pool(min(processes, len(tasks))) as pool:
+        if mode == "bytes":
+            histogram = np.zeros(256, dtype=np.int64)
+            for result in pool.imap(_count_file_range, tasks):
+                histogram += result
+            freq = {int(byte): int(histogram[byte]) for byte in np.flatnonzero(histogram)}
+        else:
+            merged = Counter()
+            for counter in pool.imap(_count_file_range, tasks):
+                merged.update(counter)
+            freq = dict(merged)
+
+    elapsed = time.perf_counter() - start_time
+    throughput = size / (1024 * 1024) / elapsed if elapsed > 0 else float('inf')
+    return freq, throughput
+
+
+class FrequencyModel:
+    """
+    Symbol frequency table that can be grown, merged, saved and fed to Huffman.
+
+    symbols and frequencies line up with the HuffmanCodec(symbols, frequencies)
+    arguments, so HuffmanCodec.from_model(model) can use a text-mode model
+    directly; bytes-mode models (int symbols) are not supported there. A model
+    built once over a corpus can be saved with save() and reloaded with load()
+    instead of being recounted.
+    """
+
+    def __init__(self, counts=None):
+        self.counts = Counter(counts or {})
+
+    @classmethod
+    def from_file(cls, path, mode="text", parallel=False):
+        if parallel:
+            freq, _ = count_chars_parallel(path, mode=mode)
+        else:
+            freq = count_chars_stream(path, mode=mode)
+        return cls(freq)
+
+    def update(self, text):
+        # Add the characters of text (or the bytes of a bytes object)
+        self.counts.update(text)
+        return self
+
+    def merge(self, other):
+        self.counts.update(other.counts)
+        return self
+
+    @property
+    def symbols(self):
+        return list(self.counts)
+
+    @property
+    def frequencies(self):
+        return list(self.counts.values())
+
+    def to_bytes(self):
+        # zlib-compressed JSON list of [symbol, count] pairs; byte symbols are ints
+        pairs = [[symbol, count] for symbol, count in self.counts.items()]
+        return zlib.compress(json.dumps(pairs, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+
+    @classmethod
+    def from_bytes(cls, data):
+        pairs = json.loads(zlib.decompress(data).decode("utf-8"))
+        return cls({symbol: count for symbol, count in pairs})
+
+    def save(self, path):
+        with open(path, "wb") as f:
+            f.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            return cls.from_bytes(f.read())
+
+
+def print_char_frequencies(char_freq, title="Character Frequency in the Provided Text:"):
+    # Optionally, sort the dictionary by frequency in descending order
+    sorted_char_freq = sorted(char_freq.items(), key=lambda item: item[1], reverse=True)
+
+    # Print the character frequencies
+    print(title + "\n")
+    for char, freq in sorted_char_freq:
+        # For better readability, represent newline and space characters explicitly
+        if char == ' ':
+            display_char = "' ' (space)"
+        elif char == '\n':
+            display_char = "'\\n' (newline)"
+        else:
+            display_char = f"'{char}'"
+        print(f"{display_char}: {freq}")
+
+
+if __name__ == "__main__":
+    # Usage: python char_counter.py [path or - for stdin] [--bytes] [--parallel]
+    args = [arg for arg in sys.argv[1:] if arg not in ("--bytes", "--parallel")]
+    if args:
+        mode = "bytes" if "--bytes" in sys.argv else "text"
+        if "--parallel" in sys.argv and args[0] != "-":
+            freq, throughput = count_chars_parallel(args[0], mode=mode)
+            print(f"Counted at {throughput:.1f} MB/s\n")
+        else:
+            freq = count_chars_stream(args[0], mode=mode)
+        print_char_frequencies(freq, title=f"Character Frequency in {args[0]}:")
     else:
-        display_char = f"'{char}'"
-    print(f"{display_char}: {freq}")
+        print_char_frequencies(count_chars(text))
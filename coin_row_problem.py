@@ -1,3 +1,6 @@
+import os
+from multiprocessing import Pool
+
 from colorama import init, Fore, Style
 
 
@@ -66,6 +69,231 @@ def coin_row_all_solutions_trace(coins):
     return dp, optimal_selections, max_value
 
 
+def coin_row_count_solutions(coins):
+    """
+    Coin-row DP that counts optimal selections instead of listing them.
+
+    Each position stores only (max_value, number_of_optimal_selections), so
+    memory stays O(n) even when the number of optimal selections grows
+    exponentially. Ties are resolved exactly as in
+    coin_row_all_solutions_trace, so the count equals the length of its
+    selection list. Use iter_optimal_selections to enumerate them lazily.
+
+    :param coins: List of coin values.
+    :return: (dp, count, max_value) where dp[i] = (F[i + 1], count at i).
+    """
+    n = len(coins)
+    if n == 0:
+        return [], 0, 0
+
+    dp = [(0, 0)] * n
+    dp[0] = (coins[0], 1)
+    if n > 1:
+        if coins[0] > coins[1]:
+            dp[1] = (coins[0], 1)
+        elif coins[0] < coins[1]:
+            dp[1] = (coins[1], 1)
+        else:  # coins[0] == coins[1]
+            dp[1] = (coins[0], 2)
+
+    for i in range(2, n):
+        sum1 = dp[i - 1][0]
+        sum2 = dp[i - 2][0] + coins[i]
+        if sum1 > sum2:
+            dp[i] = (sum1, dp[i - 1][1])
+        elif sum1 < sum2:
+            dp[i] = (sum2, dp[i - 2][1])
+        else:  # sum1 == sum2
+            dp[i] = (sum1, dp[i - 1][1] + dp[i - 2][1])
+
+    return dp, dp[n - 1][1], dp[n - 1][0]
+
+
+def iter_optimal_selections(coins, dp):
+    """
+    Lazily yields every optimal selection (0-based positions, ascending).
+
+    Walks back through the dp from coin_row_count_solutions with an explicit
+    stack, so only one partial selection per pending branch is held at a
+    time. Selections come out in the same order as coin_row_all_solutions_trace.
+    """
+    n = len(coins)
+    if n == 0:
+        return
+
+    # Stack entries: (position, positions already chosen after it)
+    stack = [(n - 1, ())]
+    while stack:
+        i, suffix = stack.pop()
+        if i == 0:
+            yield [0] + list(suffix)
+        elif i == 1:
+            if coins[0] >= coins[1]:
+                yield [0] + list(suffix)
+            if coins[0] <= coins[1]:
+                yield [1] + list(suffix)
+        else:
+            value = dp[i][0]
+            # Push the include branch first so the exclude branch comes out first
+            if dp[i - 2][0] + coins[i] == value:
+                stack.append((i - 2, (i,) + suffix))
+            if dp[i - 1][0] == value:
+                stack.append((i - 1, suffix))
+
+
+def coin_row_stream(values, return_positions=True):
+    """
+    Quiet O(n) coin-row solver over any iterable or generator of coin values.
+
+    The recurrence F[i] = max(c_i + F[i-2], F[i-1]) runs on two rolling
+    variables, so values are consumed one at a time and never stored. To
+    recover positions, one bit per coin records whether F[i] took coin i
+    (about 12 MB per hundred million coins); pass return_positions=False to
+    keep memory O(1). Ties resolve like the first selection listed by
+    coin_row_all_solutions_trace.
+
+    :param values: Iterable of coin values.
+    :param return_positions: Whether to reconstruct the optimal positions.
+    :return: (max_value, positions) with 0-based positions in ascending order,
+             or (max_value, None) when return_positions is False.
+    """
+    prev2, prev1 = 0, 0  # F[i - 2], F[i - 1]
+    taken = bytearray()
+    bits = 0
+    n = 0
+    for value in values:
+        include = prev2 + value
+        # The first coin is always taken, as in the traced solver
+        take = n == 0 or include > prev1
+        prev2, prev1 = prev1, include if take else prev1
+        if return_positions:
+            if take:
+                bits |= 1 << (n & 7)
+            if n & 7 == 7:
+                taken.append(bits)
+                bits = 0
+        n += 1
+
+    if not return_positions:
+        return prev1, None
+    if n & 7:
+        taken.append(bits)
+
+    # Walk back through the recorded decisions
+    positions = []
+    i = n - 1
+    while i >= 0:
+        if taken[i >> 3] >> (i & 7) & 1:
+            positions.append(i)
+            i -= 2
+        else:
+            i -= 1
+    positions.reverse()
+
+    return prev1, positions
+
+
+NEG_INF = float('-inf')
+
+
+def _max_plus_chunk_matrix(values):
+    # Max-plus 2x2 matrix M of a chunk: (F[end], F[end - 1]) = M (x) (F[start - 1], F[start - 2]).
+    # Each F is tracked as its coefficients on the two start values.
+    cur = (0, NEG_INF)
+    prev = (NEG_INF, 0)
+    for value in values:
+        cur, prev = (max(cur[0], prev[0] + value), max(cur[1], prev[1] + value)), cur
+    return (cur, prev)
+
+
+def _max_plus_apply(matrix, state):
+    return tuple(max(matrix[i][0] + state[0], matrix[i][1] + state[1]) for i in range(2))
+
+
+# Coin sequence of the current coin_row_parallel call, set in each worker by
+# the pool initializer so tasks only carry index ranges
+_worker_coins = None
+
+
+def _set_worker_coins(coins):
+    global _worker_coins
+    _worker_coins = coins
+
+
+def _coin_row_chunk_matrix(bounds):
+    start, stop = bounds
+    return _max_plus_chunk_matrix(_worker_coins[start:stop])
+
+
+def _coin_row_chunk_decisions(args):
+    # Replays one chunk from its exact start state, recording take decisions
+    (start, stop), (prev1, prev2) = args
+    taken = bytearray(stop - start)
+    for k, value in enumerate(_worker_coins[start:stop]):
+        include = prev2 + value
+        if include > prev1:
+            taken[k] = 1
+            prev2, prev1 = prev1, include
+        else:
+            prev2 = prev1
+    return taken
+
+
+def coin_row_parallel(coins, processes=None, min_chunk=100000):
+    """
+    Coin-row solver that splits the sequence into chunks solved in parallel.
+
+    The step F[i] = max(c_i + F[i-2], F[i-1]) is a 2x2 max-plus linear map on
+    (F[i-1], F[i-2]), so each worker reduces its chunk to one such matrix.
+    The parent then applies the chunk matrices in order (a serial O(chunks)
+    fold) to get the exact state entering every chunk; a second parallel
+    pass replays each chunk from that state to record take decisions, which
+    are walked back sequentially. Results match coin_row_stream, including
+    tie-breaking. The workers receive coins once, through the pool
+    initializer (inherited without copying under the fork start method),
+    and both passes send only chunk index ranges.
+
+    :param coins: Sequence of coin values (must support slicing).
+    :param processes: Number of worker processes, defaults to os.cpu_count().
+    :param min_chunk: Smallest chunk worth a process; short inputs run sequentially.
+    :return: (max_value, positions) with 0-based positions in ascending order.
+    """
+    n = len(coins)
+    processes = processes or os.cpu_count() or 1
+    chunks = min(processes, (n - 1) // min_chunk) if n > 1 else 0
+    if chunks < 2:
+        return coin_row_stream(coins)
+
+    # The first coin is always taken, so chunking starts at index 1
+    bounds = [1 + (n - 1) * t // chunks for t in range(chunks + 1)]
+    ranges = [(bounds[t], bounds[t + 1]) for t in range(chunks)]
+
+    with Pool(chunks, initializer=_set_worker_coins, initargs=(coins,)) as pool:
+        matrices = pool.map(_coin_row_chunk_matrix, ranges)
+
+        # states[t] is the exact (F[start - 1], F[start - 2]) entering chunk t
+        states = [(coins[0], 0)]
+        for matrix in matrices:
+            states.append(_max_plus_apply(matrix, states[-1]))
+        decisions = pool.map(_coin_row_chunk_decisions, zip(ranges, states))
+
+    max_value = states[-1][0]
+    taken = bytearray([1]) + b"".join(decisions)
+
+    # Walk back through the recorded decisions
+    positions = []
+    i = n - 1
+    while i >= 0:
+        if taken[i]:
+            positions.append(i)
+            i -= 2
+        else:
+            i -= 1
+    positions.reverse()
+
+    return max_value, positions
+
+
 def print_dp_table(i, coins, dp_values):
     # i: current position (0-based index)
     # coins: list of coin values
@@ -1,3 +1,9 @@
+import random
+import sys
+import time
+
+import numpy as np
+
 def does_something(A, x, y):
     """
     Input:
@@ -32,8 +38,168 @@ def does_something(A, x, y):
     return C
 
 
+def radix_sort(A):
+    """
+    LSD radix sort on bytes, stable, for integers of any range.
+
+    Values are shifted by min(A) so negatives work, then bucketed one byte
+    at a time. Cost is O(passes * (n + 256)) where passes is the number of
+    bytes in max(A) - min(A), independent of how sparse the values are.
+    """
+    if not A:
+        return []
+    x = min(A)
+    keys = [a - x for a in A]
+    span = max(keys)
+
+    shift = 0
+    while span >> shift:
+        buckets = [[] for _ in range(256)]
+        for key in keys:
+            buckets[(key >> shift) & 0xFF].append(key)
+        keys = [key for bucket in buckets for key in bucket]
+        shift += 8
+
+    return [key + x for key in keys]
+
+
+def sort_integers(A):
+    """
+    Sorts integers, choosing counting sort or radix sort from the value range.
+
+    Counting sort costs about n + k for a range of k values; byte-wise radix
+    sort costs about passes * (n + 256). Counting sort is used when it is the
+    cheaper of the two, so a handful of values spread across a 64-bit range
+    never allocates a count array of that size.
+
+    :param A: List of integers.
+    :return: (sorted list, name of the method used)
+    """
+    if not A:
+        return [], "counting"
+    x, y = min(A), max(A)
+    k = y - x + 1
+    passes = max(1, ((y - x).bit_length() + 7) // 8)
+    if len(A) + k <= passes * (len(A) + 256):
+        return does_something(A, x, y), "counting"
+    return radix_sort(A), "radix"
+
+
+def counting_sort_numpy(A, x=None, y=None):
+    """
+    Vectorized counting sort of integers with np.bincount.
+
+    The histogram of A - x is built in one np.bincount call and each value is
+    written out count times with np.repeat, so there is no Python-level loop.
+    When the range is too wide for a count array (by the same cost rule as
+    sort_integers), the array is sorted with argsort_by_key instead.
+
+    :param A: Array-like of integers between x and y (inclusive).
+    :return: Sorted NumPy array.
+    """
+    A = np.asarray(A)
+    if not np.issubdtype(A.dtype, np.integer):
+        raise ValueError("counting_sort_numpy needs an integer array")
+    if A.size == 0:
+        return A.copy()
+    x = int(A.min()) if x is None else int(x)
+    y = int(A.max()) if y is None else int(y)
+    k = y - x + 1
+    passes = max(1, ((y - x).bit_length() + 7) // 8)
+    if A.size + k > passes * (A.size + 256):
+        return A[argsort_by_key(A)]
+    # Offsets and output values in modular uint64 arithmetic, so small dtypes
+    # cannot overflow and uint64 values above the int64 range stay exact
+    if A.dtype.kind == 'u':
+        keys64 = A.astype(np.uint64)
+    else:
+        keys64 = A.astype(np.int64).view(np.uint64)
+    low = np.uint64(x % 2 ** 64)
+    counts = np.bincount((keys64 - low).astype(np.int64), minlength=k)
+    values = (np.arange(k, dtype=np.uint64) + low).astype(A.dtype)
+    return np.repeat(values, counts)
+
+
+def argsort_by_key(records, key=None):
+    """
+    Stable permutation index that sorts records by an integer key.
+
+    Keys are shifted by their minimum and sorted one 16-bit digit at a time
+    (least significant first). Each pass is a stable argsort of a uint16
+    digit array, for which NumPy uses its counting-based radix sort, so
+    millions of rows are sorted without Python-level iteration.
+
+    :param records: Structured array, 2-D array or 1-D array of keys.
+    :param key: Field name for structured arrays, column index for 2-D arrays,
+                or None when records is already the key array.
+    :return: Permutation index; records[perm] is sorted by key, ties kept in input order.
+    """
+    records = np.asarray(records)
+    if key is None:
+        keys = records
+    elif records.dtype.names is not None:
+        keys = records[key]
+    else:
+        keys = records[:, key]
+    if not np.issubdtype(keys.dtype, np.integer):
+        raise ValueError("Sort key must be an integer column")
+    if keys.size == 0:
+        return np.arange(0)
+
+    # Shift to non-negative offsets; modular uint64 arithmetic keeps the
+    # full 64-bit span exact
+    low = int(keys.min())
+    if keys.dtype.kind == 'u':
+        keys64 = keys.astype(np.uint64)
+    else:
+        keys64 = keys.astype(np.int64).view(np.uint64)
+    offsets = keys64 - np.uint64(low % 2 ** 64)
+    span = int(offsets.max())
+
+    perm = np.argsort((offsets & 0xFFFF).astype(np.uint16), kind='stable')
+    shift = 16
+    while span >> shift:
+        digits = ((offsets[perm] >> np.uint64(shift)) & np.uint64(0xFFFF)).astype(np.uint16)
+        perm = perm[np.argsort(digits, kind='stable')]
+        shift += 16
+    return perm
+
+
+def benchmark_sorts(cases=((10000, 100), (10000, 10 ** 6), (100000, 1000), (100000, 2 ** 32), (1000, 2 ** 64)),
+                    repeat=3, seed=0):
+    # Time counting sort, radix sort and sort_integers over size/range combinations
+    rng = random.Random(seed)
+    print(f"{'n':>8}{'range':>24}{'counting (s)':>14}{'radix (s)':>12}{'auto (s)':>12}  method")
+    for n, value_range in cases:
+        A = [rng.randrange(-(value_range // 2), value_range - value_range // 2) for _ in range(n)]
+        x, y = min(A), max(A)
+        expected = sorted(A)
+
+        def best_time(sort):
+            best = float('inf')
+            for _ in range(repeat):
+                start = time.perf_counter()
+                result = sort()
+                best = min(best, time.perf_counter() - start)
+            assert result == expected
+            return best
+
+        # Counting sort is skipped when its count array would be too large
+        if y - x + 1 <= 10 ** 7:
+            counting = f"{best_time(lambda: does_something(A, x, y)):.4f}"
+        else:
+            counting = "skipped"
+        radix = best_time(lambda: radix_sort(A))
+        auto = best_time(lambda: sort_integers(A)[0])
+        print(f"{n:>8}{value_range:>24}{counting:>14}{radix:>12.4f}{auto:>12.4f}  {sort_integers(A)[1]}")
+
+
 # Example usage
 if __name__ == "__main__":
+    if "--benchmark" in sys.argv:
+        benchmark_sorts()
+        sys.exit()
+
     A = [6, 0, 2, 0, 1, 3, 4, 6, 1, 3, 2]
     x = min(A)
     y = max(A)
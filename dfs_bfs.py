@@ -1,5 +1,11 @@
+import contextlib
+import os
+import sys
+import time
+
 import matplotlib.pyplot as plt
 import networkx as nx
+import numpy as np
 from collections import deque
 
 def traverse_graph(graph, start_node, use_bfs=True):
@@ -46,6 +52,237 @@ def traverse_graph(graph, start_node, use_bfs=True):
 
     return traversal_order, traversal_edges
 
+class CSRGraph:
+    """
+    Compact integer-indexed graph in CSR (compressed sparse row) form.
+
+    The neighbors of node i are neighbors[offsets[i]:offsets[i + 1]], in the
+    same order as in the adjacency list they came from. labels maps node
+    indices back to the original node names and index maps names to indices.
+    """
+
+    def __init__(self, offsets, neighbors, labels=None):
+        self.offsets = np.asarray(offsets, dtype=np.int64)
+        self.neighbors = np.asarray(neighbors)
+        self.num_nodes = len(self.offsets) - 1
+        self.labels = list(labels) if labels is not None else list(range(self.num_nodes))
+        self.index = {label: i for i, label in enumerate(self.labels)}
+
+    @classmethod
+    def from_adjacency(cls, graph):
+        """
+        Converts the adjacency-dict format used by traverse_graph.
+
+        Nodes are numbered in dictionary order, followed by any node that only
+        appears as a neighbor.
+        """
+        labels = list(graph)
+        index = {label: i for i, label in enumerate(labels)}
+        for neighbors in graph.values():
+            for neighbor in neighbors:
+                if neighbor not in index:
+                    index[neighbor] = len(labels)
+                    labels.append(neighbor)
+
+        degrees = np.zeros(len(labels) + 1, dtype=np.int64)
+        for label, neighbors in graph.items():
+            degrees[index[label] + 1] = len(neighbors)
+        offsets = np.cumsum(degrees)
+
+        dtype = np.int32 if len(labels) < 2 ** 31 else np.int64
+        neighbors = np.empty(offsets[-1], dtype=dtype)
+        for label, adjacent in graph.items():
+            start = offsets[index[label]]
+            neighbors[start:start + len(adjacent)] = [index[neighbor] for neighbor in adjacent]
+        return cls(offsets, neighbors, labels)
+
+    @classmethod
+    def from_edges(cls, num_nodes, sources, targets):
+        # Builds the CSR arrays from edge arrays, keeping edge order per source
+        sources = np.asarray(sources, dtype=np.int64)
+        targets = np.asarray(targets)
+        order = np.argsort(sources, kind='stable')
+        offsets = np.zeros(num_nodes + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum(np.bincount(sources, minlength=num_nodes))
+        return cls(offsets, targets[order])
+
+    def degrees(self):
+        return np.diff(self.offsets)
+
+    def transpose(self):
+        # Graph with every edge reversed (in-neighbors), built once and cached
+        if getattr(self, "_transpose", None) is None:
+            sources = np.repeat(np.arange(self.num_nodes, dtype=np.int64), self.degrees())
+            self._transpose = CSRGraph.from_edges(self.num_nodes, self.neighbors, sources)
+            self._transpose.labels, self._transpose.index = self.labels, self.index
+        return self._transpose
+
+def traverse_csr(csr, start_node, use_bfs=True):
+    """
+    Quiet BFS or DFS over a CSRGraph, visiting nodes in the same order as traverse_graph.
+
+    visited is a bytearray with one byte per node, and the results are
+    NumPy arrays instead of lists of Python objects.
+
+    :param csr: A CSRGraph.
+    :param start_node: Label of the node to start from.
+    :param use_bfs: Boolean value; if True, performs BFS; else performs DFS.
+    :return: (order, parent) where order holds the visited node indices and
+             parent[i] is the index that discovered node i (-1 for the start
+             node and unvisited nodes).
+    """
+    n = csr.num_nodes
+    offsets, neighbors = csr.offsets, csr.neighbors
+    visited = bytearray(n)
+    order = np.empty(n, dtype=np.int64)
+    parent = np.full(n, -1, dtype=np.int64)
+    count = 0
+    start = csr.index[start_node]
+
+    if use_bfs:
+        # Marking on enqueue gives the same order as traverse_graph's
+        # mark-on-dequeue loop without queueing duplicates
+        queue = deque([start])
+        visited[start] = 1
+        while queue:
+            node = queue.popleft()
+            order[count] = node
+            count += 1
+            for neighbor in neighbors[offsets[node]:offsets[node + 1]].tolist():
+                if not visited[neighbor]:
+                    visited[neighbor] = 1
+                    parent[neighbor] = node
+                    queue.append(neighbor)
+    else:
+        # Mark on pop, as in traverse_graph, so the preorder matches
+        stack = [(start, -1)]
+        while stack:
+            node, source = stack.pop()
+            if visited[node]:
+                continue
+            visited[node] = 1
+            parent[node] = source
+            order[count] = node
+            count += 1
+            for neighbor in reversed(neighbors[offsets[node]:offsets[node + 1]].tolist()):
+                if not visited[neighbor]:
+                    stack.append((neighbor, node))
+
+    return order[:count], parent
+
+def _gather_edges(offsets, neighbors, nodes):
+    # All edges leaving nodes as (owner position in nodes, neighbor) arrays,
+    # using fancy indexing only
+    starts = offsets[nodes]
+    counts = offsets[nodes + 1] - starts
+    total = int(counts.sum())
+    owners = np.repeat(np.arange(len(nodes)), counts)
+    positions = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts) + starts[owners]
+    return owners, neighbors[positions]
+
+def bfs_levels(csr, start_node, alpha=14, beta=24):
+    """
+    Level-synchronous, direction-optimizing BFS over a CSRGraph.
+
+    Each level is expanded as a whole with NumPy fancy indexing and masks.
+    Top-down steps gather the edges leaving the frontier; when those
+    outnumber the edges of the unvisited nodes by more than alpha, a
+    bottom-up step is used instead, where every unvisited node looks for a
+    parent among its in-neighbors in the frontier. The search goes back to
+    top-down once the frontier has fewer than num_nodes / beta nodes.
+    Levels match traverse_graph's BFS; parents may be any valid BFS parent.
+
+    :param csr: A CSRGraph.
+    :param start_node: Label of the node to start from.
+    :param alpha: Top-down to bottom-up switching factor.
+    :param beta: Bottom-up to top-down switching factor.
+    :return: (levels, parents) as NumPy arrays, -1 for unreachable nodes
+             (and for the start node's parent).
+    """
+    n = csr.num_nodes
+    offsets, neighbors = csr.offsets, csr.neighbors
+    degrees = csr.degrees()
+    levels = np.full(n, -1, dtype=np.int64)
+    parents = np.full(n, -1, dtype=np.int64)
+
+    start = csr.index[start_node]
+    levels[start] = 0
+    frontier = np.array([start], dtype=np.int64)
+    unvisited_edges = int(degrees.sum()) - int(degrees[start])
+    bottom_up = False
+    depth = 0
+
+    while len(frontier):
+        depth += 1
+        frontier_edges = int(degrees[frontier].sum())
+        if not bottom_up and frontier_edges * alpha > unvisited_edges:
+            bottom_up = True
+        elif bottom_up and len(frontier) * beta < n:
+            bottom_up = False
+
+        if bottom_up:
+            transposed = csr.transpose()
+            in_frontier = np.zeros(n, dtype=bool)
+            in_frontier[frontier] = True
+            unvisited = np.flatnonzero(levels == -1)
+            owners, candidates = _gather_edges(transposed.offsets, transposed.neighbors, unvisited)
+            hits = np.flatnonzero(in_frontier[candidates])
+            # First in-neighbor in the frontier becomes the parent
+            found, first = np.unique(owners[hits], return_index=True)
+            new_nodes = unvisited[found]
+            new_parents = candidates[hits[first]]
+        else:
+            owners, candidates = _gather_edges(offsets, neighbors, frontier)
+            fresh = levels[candidates] == -1
+            new_nodes, first = np.unique(candidates[fresh], return_index=True)
+            new_parents = frontier[owners[fresh][first]]
+
+        levels[new_nodes] = depth
+        parents[new_nodes] = new_parents
+        unvisited_edges -= int(degrees[new_nodes].sum())
+        frontier = new_nodes.astype(np.int64)
+
+    return levels, parents
+
+def _random_edges(rng, n, m, power_law=False):
+    # Uniform random edges, or edges whose endpoints follow a Zipf-like
+    # popularity so a few hub nodes get most of the edges
+    if power_law:
+        weights = 1.0 / np.arange(1, n + 1)
+        weights = rng.permutation(weights / weights.sum())
+        return rng.choice(n, m, p=weights), rng.choice(n, m, p=weights)
+    return rng.integers(0, n, m), rng.integers(0, n, m)
+
+def benchmark_bfs(sizes=((10000, 8), (100000, 8), (200000, 16)), seed=0):
+    # Compare traverse_graph, traverse_csr and bfs_levels on random and power-law graphs
+    rng = np.random.default_rng(seed)
+    print(f"{'graph':>10}{'nodes':>9}{'edges':>10}{'traverse_graph (s)':>20}"
+          f"{'traverse_csr (s)':>18}{'bfs_levels (s)':>16}")
+    for power_law in (False, True):
+        for n, average_degree in sizes:
+            sources, targets = _random_edges(rng, n, n * average_degree, power_law)
+            csr = CSRGraph.from_edges(n, sources, targets)
+            graph = {i: csr.neighbors[csr.offsets[i]:csr.offsets[i + 1]].tolist() for i in range(n)}
+            start_node = int(sources[0])
+
+            start = time.perf_counter()
+            with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+                order, _ = traverse_graph(graph, start_node, use_bfs=True)
+            dict_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            csr_order, _ = traverse_csr(csr, start_node, use_bfs=True)
+            csr_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            levels, _ = bfs_levels(csr, start_node)
+            level_time = time.perf_counter() - start
+
+            assert csr_order.tolist() == order
+            assert np.count_nonzero(levels >= 0) == len(order)
+            name = "power-law" if power_law else "random"
+            print(f"{name:>10}{n:>9}{len(sources):>10}{dict_time:>20.4f}{csr_time:>18.4f}{level_time:>16.4f}")
+
 def visualize_graph(graph, traversal_edges, traversal_order, use_bfs=True):
     """
     Visualizes the graph and highlights the traversal path.
@@ -97,6 +334,10 @@ def visualize_graph(graph, traversal_edges, traversal_order, use_bfs=True):
 
 # Example usage:
 if __name__ == "__main__":
+    if "--benchmark" in sys.argv:
+        benchmark_bfs()
+        sys.exit()
+
     # Define your graph as an adjacency list
     graph = {
         'A': ['B', 'C'],
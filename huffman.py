@@ -30,6 +30,15 @@ class HuffmanCodec:
         self._build_tree()
         self._generate_codes()
 
+    @classmethod
+    def from_model(cls, model):
+        # Build a codec straight from a text-mode char_counter.FrequencyModel;
+        # decode() builds a str, so byte-mode models (int symbols) are rejected
+        symbols = model.symbols
+        if not all(isinstance(symbol, str) for symbol in symbols):
+            raise ValueError("HuffmanCodec needs a text model with str symbols, not a bytes-mode model")
+        return cls(symbols, model.frequencies)
+
     def _build_tree(self):
         heap = []
         for char, freq in zip(self.symbols, self.frequencies):
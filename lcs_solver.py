@@ -1,5 +1,10 @@
+import sys
+
 from colorama import init, Fore, Style
 
+from table_export import write_dp_table
+from table_render import render_table
+
 
 def lcs_with_all_solutions(X, Y):
     m, n = len(X), len(Y)
@@ -32,15 +37,20 @@ def lcs_with_all_solutions(X, Y):
     return dp, all_solutions
 
 
+def write_lcs_table(X, Y, dp_table, out, fmt="tsv", rows=None, columns=None):
+    # Stream the DP table to a file path or buffer without printing it
+    def row_label(i):
+        if i == 0:
+            return str(i)
+        return f"{i}({X[i - 1]})"
+
+    return write_dp_table(dp_table, out, row_label, range(len(Y) + 1), corner="i/j",
+                          fmt=fmt, rows=rows, columns=columns)
+
+
 def print_excel_format(X, Y, dp_table):
     print(Fore.YELLOW + "\nExcel-friendly format (tab-separated, copy everything below this line):" + Style.RESET_ALL)
-    print("i/j\t" + "\t".join(str(i) for i in range(len(Y) + 1)))
-    for i in range(len(X) + 1):
-        row_values = [str(val) for val in dp_table[i]]
-        if i == 0:
-            print(f"{i}\t" + "\t".join(row_values))
-        else:
-            print(f"{i}({X[i - 1]})\t" + "\t".join(row_values))
+    write_lcs_table(X, Y, dp_table, sys.stdout)
 
 
 def print_lcs_solution(X, Y):
@@ -52,36 +62,28 @@ def print_lcs_solution(X, Y):
 
     dp_table, solutions = lcs_with_all_solutions(X, Y)
 
-    try:
-        from tabulate import tabulate
-        use_tabulate = True
-    except ImportError:
-        use_tabulate = False
-
-    # Prepare table headers with numbers
-    headers = [Fore.YELLOW + "i\\j" + Style.RESET_ALL]
-    headers.extend([Fore.YELLOW + str(j) + Style.RESET_ALL for j in range(len(Y) + 1)])
+    # Column 0 holds the index number and character, column j > 0 holds j - 1
+    def get_header(j):
+        return "i\\j" if j == 0 else str(j - 1)
+
+    def get_row(i, columns):
+        row = []
+        for j in columns:
+            if j > 0:
+                row.append(str(dp_table[i][j - 1]))
+            elif i == 0:
+                row.append("0")
+            else:
+                row.append(f"{i}({X[i - 1]})")
+        return row
 
-    table = []
-    # Add rows with index numbers and characters
-    for i in range(len(X) + 1):
-        if i == 0:
-            row_label = Fore.CYAN + "0" + Style.RESET_ALL
-        else:
-            row_label = Fore.CYAN + f"{i}({X[i - 1]})" + Style.RESET_ALL
-        row = [row_label]
-        for val in dp_table[i]:
-            row.append(str(val))
-        table.append(row)
+    def style(i, j):
+        return Fore.CYAN if j == 0 else None
 
     # Print the DP table
     print(Fore.YELLOW + "\nDynamic Programming Table:" + Style.RESET_ALL)
-    if use_tabulate:
-        print(tabulate(table, headers=headers, tablefmt="pretty"))
-    else:
-        print(" ".join(f"{str(h):>6}" for h in headers))
-        for row in table:
-            print(" ".join(f"{str(cell):>6}" for cell in row))
+    render_table(len(X) + 1, len(Y) + 2, get_row, get_header, style, fallback_width=6, fallback_align=">",
+                 fallback_separator=" ")
 
     # Print Excel-friendly format
     print_excel_format(X, Y, dp_table)
@@ -2,6 +2,8 @@ import networkx as nx
 import matplotlib.pyplot as plt
 from colorama import init, Fore, Style
 
+from table_render import render_table, alternating_row_style
+
 def find_longest_path_dag(graph):
     init(autoreset=True)  # Initialize colorama
 
@@ -64,29 +66,13 @@ def print_longest_path_solution(graph):
 
     distances, predecessors, steps, path, max_distance, path_length, edge_count = find_longest_path_dag(graph)
 
-    # Prepare data for the steps table
-    table_data = []
-    for idx, step in enumerate(steps):
-        # Alternate row colors
-        if idx % 2 == 0:
-            row_color = Fore.LIGHTMAGENTA_EX
-        else:
-            row_color = Fore.CYAN
-        table_data.append([
-            row_color + str(idx + 1) + Style.RESET_ALL,
-            row_color + str(step['from']) + Style.RESET_ALL,
-            row_color + str(step['to']) + Style.RESET_ALL,
-            row_color + str(step['weight']) + Style.RESET_ALL,
-            row_color + step['action'] + Style.RESET_ALL,
-        ])
-
-    headers = [
-        Fore.YELLOW + "Step" + Style.RESET_ALL,
-        Fore.YELLOW + "From" + Style.RESET_ALL,
-        Fore.YELLOW + "To" + Style.RESET_ALL,
-        Fore.YELLOW + "Weight" + Style.RESET_ALL,
-        Fore.YELLOW + "Action" + Style.RESET_ALL,
-    ]
+    # Rows of the steps table are built only for the steps that are displayed
+    headers = ["Step", "From", "To", "Weight", "Action"]
+
+    def get_row(idx, columns):
+        step = steps[idx]
+        row = [str(idx + 1), str(step['from']), str(step['to']), str(step['weight']), step['action']]
+        return [row[j] for j in columns]
 
     print(Fore.YELLOW + "\nLongest Path in DAG:" + Style.RESET_ALL)
     print(Fore.GREEN + f"Maximum Path Length (Total Weight): {max_distance}" + Style.RESET_ALL)
@@ -94,19 +80,8 @@ def print_longest_path_solution(graph):
     print(Fore.GREEN + f"Number of Edges in Path: {edge_count}" + Style.RESET_ALL)
     print(Fore.BLUE + "\nDetailed Steps:" + Style.RESET_ALL)
 
-    try:
-        from tabulate import tabulate
-        use_tabulate = True
-    except ImportError:
-        use_tabulate = False
-
-    if use_tabulate:
-        print(tabulate(table_data, headers=headers, tablefmt="pretty"))
-    else:
-        # Simple print if tabulate is not installed
-        print("".join(f"{h:<10}" for h in headers))
-        for row in table_data:
-            print("".join(f"{cell:<10}" for cell in row))
+    render_table(len(steps), len(headers), get_row, headers.__getitem__, alternating_row_style,
+                 fallback_width=10)
 
     # Display distances
     print(Fore.BLUE + "\nFinal Distances to Nodes:" + Style.RESET_ALL)
@@ -2,6 +2,8 @@ import networkx as nx
 import matplotlib.pyplot as plt
 from colorama import init, Fore, Style
 
+from table_render import render_table, alternating_row_style
+
 def prim_mst(graph):
     init(autoreset=True)  # Initialize colorama
 
@@ -70,48 +72,24 @@ def print_mst_solution(graph):
 
     mst_edges, total_cost, steps = prim_mst(graph)
 
-    # Prepare data for the steps table
-    table_data = []
-    for idx, step in enumerate(steps):
-        # Alternate row colors
-        if idx % 2 == 0:
-            row_color = Fore.LIGHTMAGENTA_EX
-        else:
-            row_color = Fore.CYAN
-        action_color = Fore.GREEN if step['action'] == 'Selected' else Fore.YELLOW
-        table_data.append([
-            row_color + str(idx + 1) + Style.RESET_ALL,
-            row_color + str(step['from']) + Style.RESET_ALL,
-            row_color + str(step['to']) + Style.RESET_ALL,
-            row_color + str(step['weight']) + Style.RESET_ALL,
-            action_color + step['action'] + Style.RESET_ALL,
-        ])
-
-    headers = [
-        Fore.YELLOW + "Step" + Style.RESET_ALL,
-        Fore.YELLOW + "From" + Style.RESET_ALL,
-        Fore.YELLOW + "To" + Style.RESET_ALL,
-        Fore.YELLOW + "Weight" + Style.RESET_ALL,
-        Fore.YELLOW + "Action" + Style.RESET_ALL,
-    ]
+    # Rows of the steps table are built only for the steps that are displayed
+    headers = ["Step", "From", "To", "Weight", "Action"]
+
+    def get_row(idx, columns):
+        step = steps[idx]
+        row = [str(idx + 1), str(step['from']), str(step['to']), str(step['weight']), step['action']]
+        return [row[j] for j in columns]
+
+    def style(idx, j):
+        if j == 4:
+            return Fore.GREEN if steps[idx]['action'] == 'Selected' else Fore.YELLOW
+        return alternating_row_style(idx, j)
 
     print(Fore.YELLOW + "\nMinimum Cost Spanning Tree (Prim's Algorithm):" + Style.RESET_ALL)
     print(Fore.GREEN + f"Total Cost of MST: {total_cost}" + Style.RESET_ALL)
     print(Fore.BLUE + "\nSteps and Decisions:" + Style.RESET_ALL)
 
-    try:
-        from tabulate import tabulate
-        use_tabulate = True
-    except ImportError:
-        use_tabulate = False
-
-    if use_tabulate:
-        print(tabulate(table_data, headers=headers, tablefmt="pretty"))
-    else:
-        # Simple print if tabulate is not installed
-        print("".join(f"{h:<10}" for h in headers))
-        for row in table_data:
-            print("".join(f"{cell:<10}" for cell in row))
+    render_table(len(steps), len(headers), get_row, headers.__getitem__, style, fallback_width=10)
 
     # Build and print MST paths
     start_node = list(graph.nodes())[0]
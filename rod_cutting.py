@@ -1,5 +1,7 @@
 from colorama import init, Fore, Style
 
+from table_render import render_table
+
 
 def rod_cutting(prices, rod_length):
     init(autoreset=True)  # Initialize colorama
@@ -27,44 +29,23 @@ def print_rod_cutting_solution(prices, rod_length):
 
     dp, cuts = rod_cutting(prices, rod_length)
 
-    # Prepare data for the table
-    table_data = []
-    for i in range(1, rod_length + 1):
+    # Table row r shows rod length r + 1
+    headers = ["Rod Length", "Max Revenue", "First Cut"]
+
+    def get_row(r, columns):
+        i = r + 1
+        row = [str(i), f"{dp[i]}", f"{cuts[i]}"]
+        return [row[j] for j in columns]
+
+    def style(r, j):
         # Alternate row colors
-        if i % 2 == 0:
-            row_color = Fore.LIGHTMAGENTA_EX
-        else:
-            row_color = Fore.CYAN
-        table_data.append([
-            row_color + str(i) + Style.RESET_ALL,
-            row_color + f"{dp[i]}" + Style.RESET_ALL,
-            row_color + f"{cuts[i]}" + Style.RESET_ALL,
-        ])
-
-    headers = [
-        Fore.YELLOW + "Rod Length" + Style.RESET_ALL,
-        Fore.YELLOW + "Max Revenue" + Style.RESET_ALL,
-        Fore.YELLOW + "First Cut" + Style.RESET_ALL,
-    ]
+        return Fore.LIGHTMAGENTA_EX if (r + 1) % 2 == 0 else Fore.CYAN
 
     print(Fore.YELLOW + "\nRod Cutting Solution:" + Style.RESET_ALL)
     print(Fore.GREEN + f"Maximum Revenue for Rod Length {rod_length}: {dp[rod_length]}" + Style.RESET_ALL)
     print(Fore.BLUE + "\nDP Table and Cuts:" + Style.RESET_ALL)
 
-    try:
-        from tabulate import tabulate
-        use_tabulate = True
-    except ImportError:
-        use_tabulate = False
-
-    if use_tabulate:
-        print(tabulate(table_data, headers=headers, tablefmt="pretty"))
-    else:
-        # Simple print if tabulate is not installed
-        # Print headers
-        print("".join(f"{h:<20}" for h in headers))
-        for row in table_data:
-            print("".join(f"{cell:<20}" for cell in row))
+    render_table(rod_length, len(headers), get_row, headers.__getitem__, style)
 
     # Reconstruct the solution to find which cuts were made
     print(Fore.BLUE + "\nOptimal Cuts to Achieve Maximum Revenue:" + Style.RESET_ALL)
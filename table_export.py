@@ -0,0 +1,69 @@
+import csv
+import sys
+
+
+def write_dp_table(dp_table, out, row_label, column_labels, corner="", fmt="tsv",
+                   rows=None, columns=None, chunk_rows=1024):
+    """
+    Streams a DP table to a file or buffer as TSV or CSV.
+
+    Rows are formatted and written in chunks of chunk_rows, so the full
+    text of the table is never held in memory and nothing goes through the
+    console unless out is sys.stdout.
+
+    :param dp_table: Indexable table of rows (list of lists or 2-D array).
+    :param out: A path or a writable text file-like object.
+    :param row_label: Function mapping a row index to its label.
+    :param column_labels: Sliceable sequence of column labels (a range works).
+    :param corner: Text for the top-left header cell.
+    :param fmt: "tsv" or "csv".
+    :param rows: Optional (start, stop) window of row indices.
+    :param columns: Optional (start, stop) window of column indices.
+    :param chunk_rows: Number of rows formatted per write.
+    :return: Number of table rows written (excluding the header).
+    """
+    if fmt == "tsv":
+        delimiter = "\t"
+    elif fmt == "csv":
+        delimiter = ","
+    else:
+        raise ValueError(f"Unknown table format '{fmt}'")
+
+    row_start, row_stop = rows if rows is not None else (0, len(dp_table))
+    col_start, col_stop = columns if columns is not None else (0, len(column_labels))
+    row_stop = min(row_stop, len(dp_table))
+    col_stop = min(col_stop, len(column_labels))
+
+    if isinstance(out, str):
+        with open(out, "w", newline="") as f:
+            return write_dp_table(dp_table, f, row_label, column_labels, corner, fmt,
+                                  (row_start, row_stop), (col_start, col_stop), chunk_rows)
+
+    if fmt == "tsv":
+        # TSV cells are joined as-is (no quoting), as the console tables always were
+        def write_rows(rows):
+            out.write("".join(delimiter.join(row) + "\n" for row in rows))
+    else:
+        write_rows = csv.writer(out, delimiter=delimiter, lineterminator="\n").writerows
+
+    write_rows([[corner] + [str(label) for label in column_labels[col_start:col_stop]]])
+
+    written = 0
+    for chunk_start in range(row_start, row_stop, chunk_rows):
+        chunk_stop = min(chunk_start + chunk_rows, row_stop)
+        write_rows(
+            [row_label(i)] + [str(value) for value in dp_table[i][col_start:col_stop]]
+            for i in range(chunk_start, chunk_stop)
+        )
+        written += chunk_stop - chunk_start
+
+    return written
+
+
+# Example usage
+if __name__ == "__main__":
+    table = [[i * j for j in range(6)] for i in range(4)]
+    write_dp_table(table, sys.stdout, str, [str(j) for j in range(6)], corner="i/j")
+    print()
+    write_dp_table(table, sys.stdout, str, [str(j) for j in range(6)], corner="i/j",
+                   fmt="csv", rows=(1, 3), columns=(2, 5))
@@ -0,0 +1,110 @@
+import sys
+
+from colorama import Fore, Style
+
+# Tables larger than this are shown as head/tail windows instead of in full
+MAX_ROWS = 40
+MAX_COLS = 16
+ELLIPSIS = "..."
+
+
+def _window(count, limit):
+    # Indices to show for count entries: everything if it fits, otherwise the
+    # first and last halves of limit with None marking the gap
+    if limit is None or count <= limit:
+        return list(range(count))
+    head = (limit + 1) // 2
+    tail = limit - head
+    return list(range(head)) + [None] + list(range(count - tail, count))
+
+
+def use_color(stream=None):
+    # Only build colorama strings when the output is an interactive terminal
+    stream = sys.stdout if stream is None else stream
+    isatty = getattr(stream, "isatty", None)
+    return bool(isatty and isatty())
+
+
+def render_table(num_rows, num_cols, get_row, get_header, style=None, max_rows=MAX_ROWS,
+                 max_cols=MAX_COLS, color=None, fallback_width=20, fallback_align="<",
+                 fallback_separator="", stream=None, **tabulate_kwargs):
+    """
+    Prints a table whose cells are produced lazily, keeping the cost bounded.
+
+    Only the rows and columns that will actually be shown are requested from
+    get_row/get_header, so a table with millions of rows costs the same to
+    render as one with max_rows rows. Large tables get head/tail windows with
+    "..." marking the skipped part and a summary line with the full size.
+    Colors are applied only when printing to a terminal.
+
+    :param num_rows: Total number of data rows.
+    :param num_cols: Total number of columns (including any label column).
+    :param get_row: Function (i, columns) -> list of plain cell strings for row i.
+    :param get_header: Function j -> header text for column j.
+    :param style: Optional function (i, j) -> color prefix for a cell.
+    :param max_rows: Rows shown before windowing; 0 prints only the summary.
+    :param max_cols: Columns shown before windowing; None never windows.
+    :param color: Force colors on/off; None detects a TTY.
+    :param fallback_width: Column width when tabulate is not installed.
+    :param fallback_align: Cell alignment ("<" or ">") when tabulate is not installed.
+    :param fallback_separator: Text between cells when tabulate is not installed.
+    :param stream: Output stream, defaults to sys.stdout.
+    :param tabulate_kwargs: Extra keyword arguments for tabulate.
+    """
+    stream = sys.stdout if stream is None else stream
+    if color is None:
+        color = use_color(stream)
+
+    if max_rows == 0:
+        print(f"[table with {num_rows} rows x {num_cols} columns not shown]", file=stream)
+        return
+
+    rows = _window(num_rows, max_rows)
+    cols = _window(num_cols, max_cols)
+    shown_cols = [j for j in cols if j is not None]
+
+    def place(values, fill):
+        # Re-insert the "..." column where the column window has its gap
+        values = iter(values)
+        return [fill if j is None else next(values) for j in cols]
+
+    headers = place((get_header(j) for j in shown_cols), ELLIPSIS)
+    if color:
+        headers = [Fore.YELLOW + h + Style.RESET_ALL for h in headers]
+
+    table = []
+    for i in rows:
+        if i is None:
+            table.append([ELLIPSIS] * len(cols))
+            continue
+        cells = get_row(i, shown_cols)
+        if color and style is not None:
+            cells = [
+                prefix + cell + Style.RESET_ALL if prefix else cell
+                for cell, prefix in zip(cells, (style(i, j) for j in shown_cols))
+            ]
+        table.append(place(cells, ELLIPSIS))
+
+    try:
+        from tabulate import tabulate
+        use_tabulate = True
+    except ImportError:
+        use_tabulate = False
+
+    if use_tabulate:
+        print(tabulate(table, headers=headers, tablefmt=tabulate_kwargs.pop("tablefmt", "pretty"),
+                       **tabulate_kwargs), file=stream)
+    else:
+        # Simple print if tabulate is not installed
+        print(fallback_separator.join(f"{h:{fallback_align}{fallback_width}}" for h in headers), file=stream)
+        for row in table:
+            print(fallback_separator.join(f"{cell:{fallback_align}{fallback_width}}" for cell in row), file=stream)
+
+    if None in rows or None in cols:
+        print(f"[showing {len(rows) - (None in rows)} of {num_rows} rows and "
+              f"{len(shown_cols)} of {num_cols} columns]", file=stream)
+
+
+def alternating_row_style(i, j):
+    # Row colors used by the print_*_solution tables
+    return Fore.LIGHTMAGENTA_EX if i % 2 == 0 else Fore.CYAN